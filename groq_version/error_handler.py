@@ -5,12 +5,16 @@ This module provides centralized error handling for the Financial AI Agent Syste
 including custom exception classes and error response formatting.
 """
 
-from typing import Dict, Optional, Any
-from enum import Enum
+import re
+from typing import Dict, Optional, Any, Tuple
+from enum import StrEnum
 
 
-class ErrorType(Enum):
+class ErrorType(StrEnum):
     """Enumeration of error types in the system."""
+    # Members are str instances, so they serialize and compare as their
+    # values without ``.value``. The values are identifier-like literals,
+    # which CPython already interns at compile time.
     CONFIGURATION_ERROR = "configuration_error"
     AGENT_EXECUTION_ERROR = "agent_execution_error"
     API_ERROR = "api_error"
@@ -22,6 +26,10 @@ class ErrorType(Enum):
 class FinancialAgentError(Exception):
     """Base exception class for Financial AI Agent System."""
     
+    # Slots keep BaseException from allocating a per-instance __dict__;
+    # subclasses declare empty __slots__ to preserve this
+    __slots__ = ("message", "error_type", "details", "_dict")
+    
     def __init__(
         self,
         message: str,
@@ -40,24 +48,34 @@ class FinancialAgentError(Exception):
         self.message = message
         self.error_type = error_type
         self.details = details or {}
+        # Build the serialized form once; errors are often logged, printed
+        # and serialized several times per failure
+        self._dict = {
+            "error": message,
+            "error_type": error_type,
+            "details": self.details
+        }
     
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert error to dictionary format for API responses.
         
+        The dictionary is built once at construction and shared between
+        calls, so treat it as read-only. In-place updates to ``details`` are
+        reflected; reassigning ``message``, ``error_type`` or ``details``
+        after construction is not.
+        
         Returns:
             Dict containing error information
         """
-        return {
-            "error": self.message,
-            "error_type": self.error_type.value,
-            "details": self.details
-        }
+        return self._dict
 
 
 class ConfigurationError(FinancialAgentError):
     """Exception raised for configuration-related errors."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
@@ -69,6 +87,8 @@ class ConfigurationError(FinancialAgentError):
 class AgentExecutionError(FinancialAgentError):
     """Exception raised when agent execution fails."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
@@ -80,6 +100,8 @@ class AgentExecutionError(FinancialAgentError):
 class APIError(FinancialAgentError):
     """Exception raised for API-related errors."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
@@ -91,6 +113,8 @@ class APIError(FinancialAgentError):
 class ValidationError(FinancialAgentError):
     """Exception raised for validation errors."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
@@ -102,6 +126,8 @@ class ValidationError(FinancialAgentError):
 class NetworkError(FinancialAgentError):
     """Exception raised for network-related errors."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(
             message=message,
@@ -110,6 +136,41 @@ class NetworkError(FinancialAgentError):
         )
 
 
+# Error type for common standard exceptions, looked up by exact type.
+# Other types are resolved through their MRO on first sight and added here,
+# so every exception type pays for the walk only once.
+_EXCEPTION_ERROR_TYPES: Dict[type, ErrorType] = {
+    FileNotFoundError: ErrorType.CONFIGURATION_ERROR,
+    IOError: ErrorType.CONFIGURATION_ERROR,
+    ValueError: ErrorType.VALIDATION_ERROR,
+    ConnectionError: ErrorType.NETWORK_ERROR,
+    TimeoutError: ErrorType.NETWORK_ERROR,
+}
+
+
+def _classify_exception_type(exc_type: type) -> ErrorType:
+    """
+    Map a standard exception type to an ErrorType.
+    
+    Uses the nearest class in the type's MRO that has an entry in
+    _EXCEPTION_ERROR_TYPES, and caches the result for the type.
+    
+    Args:
+        exc_type: Exception type to classify
+        
+    Returns:
+        ErrorType for the exception (UNKNOWN_ERROR if unmapped)
+    """
+    error_type = _EXCEPTION_ERROR_TYPES.get(exc_type)
+    if error_type is None:
+        error_type = next(
+            (_EXCEPTION_ERROR_TYPES[base] for base in exc_type.__mro__ if base in _EXCEPTION_ERROR_TYPES),
+            ErrorType.UNKNOWN_ERROR
+        )
+        _EXCEPTION_ERROR_TYPES[exc_type] = error_type
+    return error_type
+
+
 def format_error_response(error: Exception) -> Dict[str, Any]:
     """
     Format any exception into a standardized error response.
@@ -124,121 +185,160 @@ def format_error_response(error: Exception) -> Dict[str, Any]:
         return error.to_dict()
     
     # Handle standard Python exceptions
-    error_message = str(error)
-    error_type = ErrorType.UNKNOWN_ERROR
-    
-    # Classify common exception types
-    if isinstance(error, (FileNotFoundError, IOError)):
-        error_type = ErrorType.CONFIGURATION_ERROR
-    elif isinstance(error, ValueError):
-        error_type = ErrorType.VALIDATION_ERROR
-    elif isinstance(error, (ConnectionError, TimeoutError)):
-        error_type = ErrorType.NETWORK_ERROR
+    exc_type = type(error)
+    error_type = _classify_exception_type(exc_type)
     
     return {
-        "error": error_message,
-        "error_type": error_type.value,
+        "error": str(error),
+        "error_type": error_type,
         "details": {
-            "exception_type": type(error).__name__
+            "exception_type": exc_type.__name__
         }
     }
 
 
-def handle_configuration_error(error: Exception) -> ConfigurationError:
+# Fixed user-facing message per configuration exception type; only the
+# original error text varies between failures of these types
+_CFG_MSG_BY_TYPE: Dict[type, str] = {
+    FileNotFoundError: (
+        "Configuration file not found. "
+        "Please create a .env file with required API keys. "
+        "Use .env.example as a template."
+    ),
+}
+
+
+def _configuration_error_payload(exc_type: type, error_str: str) -> Tuple[str, Dict[str, Any]]:
     """
-    Handle configuration-related errors.
+    Build the message and details for a configuration error.
     
     Args:
-        error: Original exception
+        exc_type: Type of the original exception
+        error_str: ``str()`` of the original exception
         
     Returns:
-        ConfigurationError with formatted message
+        Tuple of (message, details)
     """
-    if isinstance(error, FileNotFoundError):
-        return ConfigurationError(
-            message=(
-                "Configuration file not found. "
-                "Please create a .env file with required API keys. "
-                "Use .env.example as a template."
-            ),
-            details={"original_error": str(error)}
-        )
-    elif isinstance(error, ValueError):
-        return ConfigurationError(
-            message=str(error),
-            details={"original_error": str(error)}
-        )
+    if issubclass(exc_type, FileNotFoundError):
+        return _CFG_MSG_BY_TYPE[FileNotFoundError], {"original_error": error_str}
+    elif issubclass(exc_type, ValueError):
+        return error_str, {"original_error": error_str}
     else:
-        return ConfigurationError(
-            message=f"Configuration error: {str(error)}",
-            details={"original_error": str(error), "exception_type": type(error).__name__}
+        return (
+            f"Configuration error: {error_str}",
+            {"original_error": error_str, "exception_type": exc_type.__name__}
         )
 
 
-def handle_agent_execution_error(error: Exception, agent_name: str = "Agent") -> AgentExecutionError:
+def handle_configuration_error(error: Exception) -> ConfigurationError:
     """
-    Handle agent execution errors.
+    Handle configuration-related errors.
     
     Args:
         error: Original exception
-        agent_name: Name of the agent that failed
         
     Returns:
-        AgentExecutionError with formatted message
+        ConfigurationError with formatted message
     """
-    error_msg = str(error).lower()
+    error_str = str(error)
     
-    # Check for ticker-related errors
-    if any(keyword in error_msg for keyword in ['ticker', 'symbol', 'not found']):
-        return AgentExecutionError(
-            message=(
-                "Invalid ticker symbol. Please verify the ticker symbol and try again. "
-                "Ensure the ticker is spelled correctly and the company is publicly traded."
-            ),
-            details={
-                "agent": agent_name,
-                "error_category": "invalid_ticker",
-                "original_error": str(error)
-            }
-        )
+    # Exact types with a fixed message skip building the payload
+    message = _CFG_MSG_BY_TYPE.get(type(error))
+    if message is not None:
+        return ConfigurationError(message=message, details={"original_error": error_str})
     
-    # Check for rate limit errors
-    if any(keyword in error_msg for keyword in ['rate limit', 'too many requests', '429']):
-        return AgentExecutionError(
-            message=(
-                "API rate limit exceeded. Please wait a moment and try again. "
-                "If the issue persists, consider reducing query frequency."
-            ),
-            details={
-                "agent": agent_name,
-                "error_category": "rate_limit",
-                "original_error": str(error)
-            }
-        )
+    message, details = _configuration_error_payload(type(error), error_str)
+    return ConfigurationError(message=message, details=details)
+
+
+# Keywords that classify agent execution errors, one named group per category.
+# Matched against the lowercased error message in a single pass.
+_AGENT_ERROR_CATEGORY_RE = re.compile(
+    r"(?P<invalid_ticker>ticker|symbol|not found)"
+    r"|(?P<rate_limit>rate limit|too many requests|429)"
+    r"|(?P<network>connection|timeout|network)"
+)
+
+# User-facing message per category, in priority order
+# (a ticker error wins over a rate limit, which wins over a network error)
+_AGENT_ERROR_CATEGORY_MESSAGES = {
+    "invalid_ticker": (
+        "Invalid ticker symbol. Please verify the ticker symbol and try again. "
+        "Ensure the ticker is spelled correctly and the company is publicly traded."
+    ),
+    "rate_limit": (
+        "API rate limit exceeded. Please wait a moment and try again. "
+        "If the issue persists, consider reducing query frequency."
+    ),
+    "network": (
+        "Network error occurred while processing your request. "
+        "Please check your internet connection and try again."
+    ),
+}
+
+
+def _classify_agent_error(
+    exc_type_name: str,
+    error_str: str,
+    agent_name: str
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Classify an agent execution error into a message and details.
+    
+    Args:
+        exc_type_name: Name of the original exception type
+        error_str: ``str()`` of the original exception
+        agent_name: Name of the agent that failed
+        
+    Returns:
+        Tuple of (message, details)
+    """
+    error_msg = error_str.lower()
     
-    # Check for network errors
-    if any(keyword in error_msg for keyword in ['connection', 'timeout', 'network']):
-        return AgentExecutionError(
-            message=(
-                "Network error occurred while processing your request. "
-                "Please check your internet connection and try again."
-            ),
-            details={
+    # Classify ticker, rate limit and network errors
+    found = {match.lastgroup for match in _AGENT_ERROR_CATEGORY_RE.finditer(error_msg)}
+    for category, message in _AGENT_ERROR_CATEGORY_MESSAGES.items():
+        if category in found:
+            return message, {
                 "agent": agent_name,
-                "error_category": "network",
-                "original_error": str(error)
+                "error_category": category,
+                "original_error": error_str
             }
-        )
     
     # Generic agent execution error
-    return AgentExecutionError(
-        message=f"{agent_name} execution failed: {str(error)}",
-        details={
-            "agent": agent_name,
-            "original_error": str(error),
-            "exception_type": type(error).__name__
-        }
-    )
+    return f"{agent_name} execution failed: {error_str}", {
+        "agent": agent_name,
+        "original_error": error_str,
+        "exception_type": exc_type_name
+    }
+
+
+def handle_agent_execution_error(error: Exception, agent_name: str = "Agent") -> AgentExecutionError:
+    """
+    Handle agent execution errors.
+    
+    Args:
+        error: Original exception
+        agent_name: Name of the agent that failed
+        
+    Returns:
+        AgentExecutionError with formatted message
+    """
+    # str(error) is computed once and reused for classification and details
+    message, details = _classify_agent_error(type(error).__name__, str(error), agent_name)
+    return AgentExecutionError(message=message, details=details)
+
+
+# User-friendly message per HTTP status code
+_STATUS_MSGS: Dict[int, str] = {
+    400: "Invalid request format. Please check your query and try again.",
+    401: "Authentication failed. Please check your API keys.",
+    403: "Access forbidden. Please verify your API key permissions.",
+    404: "Resource not found. Please check your request.",
+    429: "Rate limit exceeded. Please wait and try again.",
+    500: "Internal server error. Please try again later.",
+    503: "Service temporarily unavailable. Please try again later.",
+}
 
 
 def handle_api_error(error: Exception, status_code: Optional[int] = None) -> APIError:
@@ -252,8 +352,9 @@ def handle_api_error(error: Exception, status_code: Optional[int] = None) -> API
     Returns:
         APIError with formatted message
     """
+    error_str = str(error)
     details = {
-        "original_error": str(error),
+        "original_error": error_str,
         "exception_type": type(error).__name__
     }
     
@@ -261,21 +362,6 @@ def handle_api_error(error: Exception, status_code: Optional[int] = None) -> API
         details["status_code"] = status_code
     
     # Map common status codes to user-friendly messages
-    if status_code == 400:
-        message = "Invalid request format. Please check your query and try again."
-    elif status_code == 401:
-        message = "Authentication failed. Please check your API keys."
-    elif status_code == 403:
-        message = "Access forbidden. Please verify your API key permissions."
-    elif status_code == 404:
-        message = "Resource not found. Please check your request."
-    elif status_code == 429:
-        message = "Rate limit exceeded. Please wait and try again."
-    elif status_code == 500:
-        message = "Internal server error. Please try again later."
-    elif status_code == 503:
-        message = "Service temporarily unavailable. Please try again later."
-    else:
-        message = f"API error occurred: {str(error)}"
+    message = _STATUS_MSGS.get(status_code) or f"API error occurred: {error_str}"
     
     return APIError(message=message, details=details)
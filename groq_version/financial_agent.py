@@ -9,15 +9,15 @@ Usage:
     python financial_agent.py                           # Run sample queries
     python financial_agent.py --query "Your question"   # Run custom query
     python financial_agent.py --query "Your question" --agent financial  # Use specific agent
+    python financial_agent.py --sequential              # Run sample queries one at a time
 """
 
 import os
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from io import StringIO
 from config import load_config
-from multi_agent import multi_agent_system
-from web_search_agent import web_search_agent
-from financial_agent_module import financial_agent
 from error_handler import (
     FinancialAgentError,
     ConfigurationError,
@@ -32,31 +32,23 @@ import time
 setup_logging(level="INFO", enable_console=False)  # Disable console to avoid cluttering output
 logger = get_logger("main")
 
-
-def print_separator(char="=", length=80):
-    """
-    Print a separator line for better output formatting.
-    
-    Args:
-        char: Character to use for the separator line (default: "=")
-        length: Length of the separator line (default: 80)
-    """
-    print(char * length)
+# Separator lines used throughout the console output
+_SEP_EQ = "=" * 80
+_SEP_DASH = "-" * 80
 
 
-def print_header(text):
+def print_header(text, file=None):
     """
     Print a formatted header with separators.
     
     Args:
         text: Header text to display
+        file: Stream to write to (default: sys.stdout)
     """
-    print_separator()
-    print(f"  {text}")
-    print_separator()
+    (file or sys.stdout).write(f"{_SEP_EQ}\n  {text}\n{_SEP_EQ}\n")
 
 
-def format_response(response):
+def format_response(response, file=None):
     """
     Format and display the agent response.
     
@@ -68,19 +60,18 @@ def format_response(response):
             - If response has 'content' attribute, displays that
             - If response is a string, displays it directly
             - Otherwise, converts to string and displays
+        file: Stream to write to (default: sys.stdout)
     """
-    print("\n[RESPONSE]:")
-    print_separator("-")
-    
     # Handle different response types
     if hasattr(response, 'content'):
-        print(response.content)
+        content = response.content
     elif isinstance(response, str):
-        print(response)
+        content = response
     else:
-        print(str(response))
+        content = str(response)
     
-    print_separator("-")
+    # Write the whole block at once rather than line by line
+    (file or sys.stdout).write(f"\n[RESPONSE]:\n{_SEP_DASH}\n{content}\n{_SEP_DASH}\n")
 
 
 def parse_arguments():
@@ -117,10 +108,49 @@ Examples:
         help='Specify which agent to use: financial, web, or multi (default: multi)'
     )
     
+    parser.add_argument(
+        '--sequential',
+        action='store_true',
+        help='Run sample queries one at a time instead of concurrently'
+    )
+    
     return parser.parse_args()
 
 
-def execute_query(query, agent_type='multi'):
+def _load_financial_agent(fresh=False):
+    """Import and return the shared (or, if fresh, a new) Financial Agent."""
+    from financial_agent_module import create_financial_agent, get_financial_agent
+    return create_financial_agent() if fresh else get_financial_agent()
+
+
+def _load_web_search_agent(fresh=False):
+    """Import and return the shared (or, if fresh, a new) Web Search Agent."""
+    from web_search_agent import create_web_search_agent, get_web_search_agent
+    return create_web_search_agent() if fresh else get_web_search_agent()
+
+
+def _load_multi_agent_system(fresh=False):
+    """
+    Import and return the Multi-Agent System.
+    
+    The parallel system builds new agents for every query, so there is no
+    shared instance to avoid and ``fresh`` makes no difference.
+    """
+    from multi_agent import ParallelMultiAgentSystem
+    return ParallelMultiAgentSystem()
+
+
+# Agent dispatch table: agent_type -> (display name, loader)
+# Loaders import the agent module on first use, so only the selected
+# agent's dependencies are loaded
+_AGENT_MAP = {
+    'financial': ('Financial Agent', _load_financial_agent),
+    'web': ('Web Search Agent', _load_web_search_agent),
+    'multi': ('Multi-Agent System', _load_multi_agent_system),
+}
+
+
+def execute_query(query, agent_type='multi', file=None, fresh_agent=False):
     """
     Execute a query using the specified agent.
     
@@ -129,46 +159,44 @@ def execute_query(query, agent_type='multi'):
     
     Args:
         query: User query string to execute
-        agent_type: Type of agent to use:
+        agent_type: Type of agent to use (a key of _AGENT_MAP):
             - 'financial': Use Financial Agent only
             - 'web': Use Web Search Agent only
             - 'multi': Use Multi-Agent System (default)
+        file: Stream for console output (default: sys.stdout). Concurrent
+            callers pass their own buffer so output is not interleaved.
+        fresh_agent: Use a new agent instead of the shared one. Agents keep
+            per-run state, so concurrent queries to the same agent type
+            must not share an instance.
     
     Returns:
         bool: True if query executed successfully, False otherwise
     """
     # Select the appropriate agent based on agent_type
     # Each agent is specialized for different types of queries
-    agent_map = {
-        'financial': ('Financial Agent', financial_agent),
-        'web': ('Web Search Agent', web_search_agent),
-        'multi': ('Multi-Agent System', multi_agent_system)
-    }
-    
-    agent_name, agent = agent_map.get(agent_type, ('Multi-Agent System', multi_agent_system))
+    agent_name, load_agent = _AGENT_MAP[agent_type]
+    agent = load_agent(fresh=fresh_agent)
     
-    print(f"\n[*] Using: {agent_name}")
-    print(f"[?] Query: {query}")
-    print_separator("-")
+    (file or sys.stdout).write(f"\n[*] Using: {agent_name}\n[?] Query: {query}\n{_SEP_DASH}\n")
     
     # Log the query
     log_query(logger, query, agent_name=agent_name)
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
-        logger.info(f"Executing query with {agent_name}")
+        logger.info("Executing query with %s", agent_name)
         response = agent.run(query)
-        format_response(response)
+        format_response(response, file=file)
         
         # Display tool calls if available
         if hasattr(response, 'tool_calls') and response.tool_calls:
-            print("\n[*] Tool Calls:")
+            print("\n[*] Tool Calls:", file=file)
             for tool_call in response.tool_calls:
-                print(f"  - {tool_call}")
+                print(f"  - {tool_call}", file=file)
         
         # Log successful execution
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
         log_response(logger, success=True, agent_name=agent_name, execution_time=execution_time)
         
         return True
@@ -178,13 +206,13 @@ def execute_query(query, agent_type='multi'):
         
         # Handle custom errors
         error_dict = e.to_dict()
-        print(f"\n[-] Error: {error_dict['error']}")
-        print(f"Error Type: {error_dict['error_type']}")
+        print(f"\n[-] Error: {error_dict['error']}", file=file)
+        print(f"Error Type: {error_dict['error_type']}", file=file)
         if error_dict.get('details'):
-            print(f"Details: {error_dict['details']}")
+            print(f"Details: {error_dict['details']}", file=file)
         
         # Log failed execution
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
         log_response(logger, success=False, agent_name=agent_name, execution_time=execution_time)
         
         return False
@@ -195,17 +223,45 @@ def execute_query(query, agent_type='multi'):
         # Handle unexpected errors
         error = handle_agent_execution_error(e, agent_name=agent_name)
         error_dict = error.to_dict()
-        print(f"\n[-] Error: {error_dict['error']}")
-        print(f"Error Type: {error_dict['error_type']}")
+        print(f"\n[-] Error: {error_dict['error']}", file=file)
+        print(f"Error Type: {error_dict['error_type']}", file=file)
         
         # Log failed execution
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
         log_response(logger, success=False, agent_name=agent_name, execution_time=execution_time)
         
         return False
 
 
-def run_sample_queries():
+# Sample queries showcasing each agent type: (title, query, agent_type)
+SAMPLE_QUERIES = (
+    # Sample Query 1: Financial data
+    ("Financial Data", "What is the current price of AAPL?", 'financial'),
+    # Sample Query 2: Web search
+    ("Web Search", "Latest news about artificial intelligence", 'web'),
+    # Sample Query 3: Multi-agent query
+    ("Multi-Agent Coordination",
+     "Summarize analyst recommendations and latest news for NVIDIA", 'multi'),
+)
+
+
+def _run_buffered(query, agent_type):
+    """
+    Execute a query, capturing its console output.
+    
+    Args:
+        query: User query string to execute
+        agent_type: Type of agent to use (see execute_query)
+    
+    Returns:
+        str: Everything execute_query printed for this query
+    """
+    buffer = StringIO()
+    execute_query(query, agent_type=agent_type, file=buffer)
+    return buffer.getvalue()
+
+
+def run_sample_queries(sequential=False):
     """
     Execute predefined sample queries to demonstrate functionality.
     
@@ -214,30 +270,91 @@ def run_sample_queries():
         1. Financial Agent - Stock price query
         2. Web Search Agent - General web search
         3. Multi-Agent System - Combined query requiring both agents
-    """
-    print("\n" + "=" * 80)
-    print("SAMPLE QUERY EXECUTION")
-    print("=" * 80)
     
-    # Sample Query 1: Financial data
-    print("\n\n[1] Query 1: Financial Data")
-    execute_query("What is the current price of AAPL?", agent_type='financial')
+    The queries are independent and network-bound, so by default they run
+    concurrently and each one's output is printed, in order, once all have
+    finished. Total time is roughly that of the slowest query.
     
-    # Sample Query 2: Web search
-    print("\n\n[2] Query 2: Web Search")
-    execute_query("Latest news about artificial intelligence", agent_type='web')
+    Args:
+        sequential: Run queries one at a time, printing output as it happens
+    """
+    sys.stdout.write(f"\n{_SEP_EQ}\nSAMPLE QUERY EXECUTION\n{_SEP_EQ}\n")
     
-    # Sample Query 3: Multi-agent query
-    print("\n\n[3] Query 3: Multi-Agent Coordination")
-    execute_query(
-        "Summarize analyst recommendations and latest news for NVIDIA",
-        agent_type='multi'
-    )
+    if sequential:
+        for number, (title, query, agent_type) in enumerate(SAMPLE_QUERIES, start=1):
+            print(f"\n\n[{number}] Query {number}: {title}")
+            execute_query(query, agent_type=agent_type)
+    else:
+        with ThreadPoolExecutor(max_workers=len(SAMPLE_QUERIES)) as executor:
+            futures = [
+                executor.submit(_run_buffered, query, agent_type)
+                for _, query, agent_type in SAMPLE_QUERIES
+            ]
+            
+            # Print each query's buffered output in submission order
+            for number, ((title, _, _), future) in enumerate(zip(SAMPLE_QUERIES, futures), start=1):
+                print(f"\n\n[{number}] Query {number}: {title}")
+                sys.stdout.write(future.result())
     
     # Completion message
-    print("\n" + "=" * 80)
-    print("[+] Sample queries completed!")
-    print("=" * 80)
+    sys.stdout.write(f"\n{_SEP_EQ}\n[+] Sample queries completed!\n{_SEP_EQ}\n")
+
+
+def configure_environment():
+    """
+    Load configuration and export the API keys the agents read.
+    
+    load_config() is cached, so repeated calls only re-export the keys.
+    
+    Returns:
+        Dict[str, str]: Validated configuration from load_config()
+    
+    Raises:
+        ConfigurationError: If the .env file or required keys are missing
+    """
+    config = load_config()
+    
+    # Set API keys in environment
+    os.environ['PHIDATA_API_KEY'] = config['phidata_api_key']
+    os.environ['PHI_API_KEY'] = config['phidata_api_key']  # Phidata also checks PHI_API_KEY
+    # Groq and OpenAI keys are optional in some configurations
+    if 'groq_api_key' in config:
+        os.environ['GROQ_API_KEY'] = config['groq_api_key']
+    if 'openai_api_key' in config:
+        os.environ['OPENAI_API_KEY'] = config['openai_api_key']
+    
+    return config
+
+
+def run_query(query, agent_type='multi'):
+    """
+    Execute a query in-process and capture its console output.
+    
+    Equivalent to ``python financial_agent.py --query ... --agent ...``
+    without starting a new interpreter, so callers running many queries
+    (e.g. test_end_to_end.py) pay import and client setup costs once.
+    Each call uses a fresh agent, so calls may run concurrently.
+    
+    Args:
+        query: User query string to execute
+        agent_type: Type of agent to use: 'financial', 'web' or 'multi'
+    
+    Returns:
+        Tuple[int, str, str]: (exit_code, stdout, stderr), matching what the
+            command-line run would produce
+    """
+    stdout, stderr = StringIO(), StringIO()
+    
+    try:
+        configure_environment()
+    except Exception as e:
+        log_error(logger, e, context={"stage": "configuration"})
+        error = e if isinstance(e, ConfigurationError) else handle_configuration_error(e)
+        stderr.write(f"[-] Configuration Error: {error.message}\n")
+        return 1, stdout.getvalue(), stderr.getvalue()
+    
+    success = execute_query(query, agent_type=agent_type, file=stdout, fresh_agent=True)
+    return (0 if success else 1), stdout.getvalue(), stderr.getvalue()
 
 
 def main():
@@ -254,18 +371,10 @@ def main():
     logger.info("Starting Financial AI Agent System")
     try:
         logger.info("Loading configuration")
-        config = load_config()
+        configure_environment()
         print("[+] Configuration loaded successfully")
         logger.info("Configuration loaded successfully")
         
-        # Set API keys in environment
-        os.environ['PHIDATA_API_KEY'] = config['phidata_api_key']
-        os.environ['PHI_API_KEY'] = config['phidata_api_key']  # Phidata also checks PHI_API_KEY
-        os.environ['GROQ_API_KEY'] = config['groq_api_key']
-        # OpenAI key is optional
-        if 'openai_api_key' in config:
-            os.environ['OPENAI_API_KEY'] = config['openai_api_key']
-        
     except ConfigurationError as e:
         log_error(logger, e, context={"stage": "configuration"})
         error_dict = e.to_dict()
@@ -280,20 +389,15 @@ def main():
         print(f"[-] Configuration Error: {error_dict['error']}")
         sys.exit(1)
     
-    # Step 2: Initialize agents
-    print("\n[*] Initializing agents...")
-    logger.info("Initializing agents")
-    print("  - Web Search Agent: Ready")
-    print("  - Financial Agent: Ready")
-    print("  - Multi-Agent System: Ready")
-    logger.info("All agents initialized successfully")
+    # Step 2: Agents are imported and initialized on first use by
+    # execute_query, so a single-agent query only loads that agent
+    print("\n[*] Agents will be initialized on first use")
+    logger.info("Deferring agent initialization until first query")
     
     # Step 3: Execute queries
     if args.query:
         # Execute custom query
-        print("\n" + "=" * 80)
-        print("CUSTOM QUERY EXECUTION")
-        print("=" * 80)
+        sys.stdout.write(f"\n{_SEP_EQ}\nCUSTOM QUERY EXECUTION\n{_SEP_EQ}\n")
         
         success = execute_query(args.query, agent_type=args.agent)
         
@@ -304,7 +408,7 @@ def main():
             sys.exit(1)
     else:
         # Run sample queries
-        run_sample_queries()
+        run_sample_queries(sequential=args.sequential)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+"""
+Model Factory Module (Groq Version)
+
+This module builds the Groq models used by the agents. Every model shares one
+synchronous and one asynchronous Groq client, so all agents reuse the same
+connection pools to the Groq API instead of each model opening its own.
+
+Model instances themselves are not shared: phidata registers each agent's
+tools and system prompt on its model, so every agent needs its own.
+
+Example:
+    >>> from model_factory import get_groq_model
+    >>> agent = Agent(name="MyAgent", model=get_groq_model())
+"""
+
+from functools import lru_cache
+from groq import AsyncGroq as AsyncGroqClient, DefaultAsyncHttpxClient, DefaultHttpxClient, Groq as GroqClient
+from phi.model.groq import Groq
+from config import MODEL_ID
+
+
+@lru_cache(maxsize=1)
+def _shared_client() -> GroqClient:
+    """
+    Get the synchronous Groq client shared by all models (used by ``run``).
+    
+    The API key is read from the GROQ_API_KEY environment variable, so the
+    configuration must be loaded before the first model is created.
+    
+    Returns:
+        GroqClient: Process-wide client with the SDK's default HTTP settings
+    """
+    return GroqClient(http_client=DefaultHttpxClient())
+
+
+@lru_cache(maxsize=1)
+def _shared_async_client() -> AsyncGroqClient:
+    """
+    Get the asynchronous Groq client shared by all models (used by ``arun``,
+    e.g. in the playground).
+    
+    The Groq SDK only accepts an ``httpx.AsyncClient`` here, so it gets its
+    own connection pool rather than the synchronous client's.
+    
+    Returns:
+        AsyncGroqClient: Process-wide client with the SDK's default HTTP settings
+    """
+    return AsyncGroqClient(http_client=DefaultAsyncHttpxClient())
+
+
+def get_groq_model(model_id: str = MODEL_ID) -> Groq:
+    """
+    Create a Groq model that uses the shared Groq clients.
+    
+    Args:
+        model_id: Groq model identifier (default: config.MODEL_ID)
+        
+    Returns:
+        Groq: New model instance for a single agent
+    """
+    return Groq(id=model_id, client=_shared_client(), async_client=_shared_async_client())
@@ -22,8 +22,9 @@ Example:
     >>> print(response.content)
 """
 
+from functools import lru_cache
 from phi.agent import Agent
-from phi.model.groq import Groq
+from model_factory import get_groq_model
 from phi.tools.duckduckgo import DuckDuckGo
 
 
@@ -51,7 +52,7 @@ def create_web_search_agent() -> Agent:
     web_search_agent = Agent(
         name="WebSearchAgent",
         role="Search the web for information.",
-        model=Groq(id="llama-3.3-70b-versatile"),
+        model=get_groq_model(),
         tools=[DuckDuckGo()],
         instructions=[
             "Always include sources and URLs in your responses",
@@ -65,7 +66,24 @@ def create_web_search_agent() -> Agent:
     return web_search_agent
 
 
-# Initialize the agent for direct import
-# This allows users to import and use the agent directly:
-# from web_search_agent_groq import web_search_agent
-web_search_agent = create_web_search_agent()
+@lru_cache(maxsize=1)
+def get_web_search_agent() -> Agent:
+    """
+    Get the shared Web Search Agent, creating it on first use.
+    
+    Returns:
+        Agent: The process-wide web search agent instance
+    """
+    return create_web_search_agent()
+
+
+def __getattr__(name: str):
+    """
+    Lazily create the module-level agent on first access (PEP 562).
+    
+    This keeps direct imports working without building the agent at import time:
+    from web_search_agent import web_search_agent
+    """
+    if name == "web_search_agent":
+        return get_web_search_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
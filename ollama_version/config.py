@@ -6,7 +6,8 @@ ensuring all required API keys are present before the application starts.
 """
 
 import os
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Optional
 from dotenv import load_dotenv
 from error_handler import ConfigurationError
 from logger import get_logger
@@ -14,14 +15,54 @@ from logger import get_logger
 # Initialize logger
 logger = get_logger("config")
 
+# LLM model used by all agents
+MODEL_ID = "llama3.2"
 
+# Lowercase prefixes that mark a placeholder rather than a real key
+# (.env.example uses 'your_..._here'). Only the start of a value is checked,
+# so real keys that merely contain one of these words are still accepted.
+_PLACEHOLDER_PREFIXES = ("your_", "changeme", "placeholder")
+_PLACEHOLDER_PREFIX_LEN = max(map(len, _PLACEHOLDER_PREFIXES))
+
+
+def _is_usable_key(value: Optional[str]) -> bool:
+    """
+    Check whether an API key value from the environment can be used.
+    
+    A usable value:
+        1. Exists (not None)
+        2. Is non-empty
+        3. Is not a placeholder (starts with none of _PLACEHOLDER_PREFIXES)
+    
+    Args:
+        value: Raw environment variable value
+    
+    Returns:
+        bool: True if the value looks like a real key
+    """
+    stripped = value.strip() if value else ''
+    if not stripped:
+        return False
+    # Lowercase only the few leading characters the prefix check needs
+    return not stripped[:_PLACEHOLDER_PREFIX_LEN].lower().startswith(_PLACEHOLDER_PREFIXES)
+
+
+@lru_cache(maxsize=1)
 def load_config() -> Dict[str, str]:
     """
     Load and validate configuration from .env file.
     
-    This function loads environment variables from a .env file and validates
-    that all required API keys are present. It provides clear error messages
-    for missing configuration.
+    This function loads environment variables from the .env file in the
+    current working directory and validates that all required API keys are
+    present. It provides clear error messages for missing configuration.
+    
+    Without a .env file the configuration is taken from the environment
+    alone, provided every required key is already set there (as in container
+    and CI deployments).
+    
+    The result is cached for the lifetime of the process, so repeated calls
+    do not re-read the .env file. Failed loads are not cached. Call
+    ``load_config.cache_clear()`` to force a reload (e.g. in tests).
     
     Returns:
         Dict[str, str]: Dictionary containing validated API keys with keys:
@@ -30,35 +71,14 @@ def load_config() -> Dict[str, str]:
             - 'openai_api_key': OpenAI API key
     
     Raises:
-        FileNotFoundError: If .env file is not found
+        FileNotFoundError: If .env file is not found and required keys are
+            not set in the environment
         ValueError: If any required API keys are missing
     
     Example:
         >>> config = load_config()
         >>> phidata_key = config['phidata_api_key']
     """
-    # Check if .env file exists
-    if not os.path.exists('.env'):
-        logger.error("Configuration file '.env' not found")
-        raise ConfigurationError(
-            message=(
-                "Configuration file '.env' not found. "
-                "Please create a .env file in the project root directory. "
-                "You can use .env.example as a template."
-            ),
-            details={
-                "steps": [
-                    "Copy .env.example to .env",
-                    "Replace placeholder values with your actual API keys"
-                ],
-                "required_keys": ["PHIDATA_API_KEY", "GROQ_API_KEY", "OPENAI_API_KEY"]
-            }
-        )
-    
-    # Load environment variables from .env file
-    logger.info("Loading configuration from .env file")
-    load_dotenv()
-    
     # Define required API keys
     # Maps environment variable names to config dictionary keys
     # Required keys for the system to function:
@@ -74,34 +94,56 @@ def load_config() -> Dict[str, str]:
         'OPENAI_API_KEY': 'openai_api_key'
     }
     
-    # Validate that all required keys are present
-    # Check each key for:
-    #   1. Existence (not None)
-    #   2. Non-empty value
-    #   3. Not a placeholder (doesn't contain 'your_')
-    missing_keys = []
-    config = {}
-    
-    # Check required keys
-    for env_key, config_key in required_keys.items():
-        value = os.getenv(env_key)
-        if not value or value.strip() == '' or 'your_' in value.lower():
-            missing_keys.append(env_key)
+    # Open and load the .env file in a single step; a missing file
+    # surfaces as FileNotFoundError from open()
+    try:
+        with open('.env', encoding='utf-8') as env_file:
+            logger.info("Loading configuration from .env file")
+            load_dotenv(stream=env_file)
+    except FileNotFoundError:
+        # Containers and CI usually pass the keys as environment variables
+        # without a .env file; that is fine as long as they are all set
+        if all(_is_usable_key(os.getenv(env_key)) for env_key in required_keys):
+            logger.info("No .env file found; using API keys from the environment")
         else:
-            config[config_key] = value
+            logger.error("Configuration file '.env' not found")
+            raise ConfigurationError(
+                message=(
+                    "Configuration file '.env' not found. "
+                    "Please create a .env file in the project root directory. "
+                    "You can use .env.example as a template."
+                ),
+                details={
+                    "steps": [
+                        "Copy .env.example to .env",
+                        "Replace placeholder values with your actual API keys"
+                    ],
+                    "required_keys": ["PHIDATA_API_KEY", "GROQ_API_KEY", "OPENAI_API_KEY"]
+                }
+            ) from None
+    
+    # Collect every usable key (see _is_usable_key) in one pass
+    config = {
+        config_key: value
+        for env_key, config_key in (required_keys | optional_keys).items()
+        if _is_usable_key(value := os.getenv(env_key))
+    }
     
-    # Check optional keys (don't fail if missing)
+    # Required keys that are absent, empty or placeholders (in declaration order)
+    missing_keys = [
+        env_key for env_key, config_key in required_keys.items() if config_key not in config
+    ]
+    
+    # Optional keys don't fail if missing
     for env_key, config_key in optional_keys.items():
-        value = os.getenv(env_key)
-        if value and value.strip() != '' and 'your_' not in value.lower():
-            config[config_key] = value
-            logger.info(f"Optional key {env_key} loaded")
+        if config_key in config:
+            logger.info("Optional key %s loaded", env_key)
         else:
-            logger.info(f"Optional key {env_key} not configured (skipping)")
+            logger.info("Optional key %s not configured (skipping)", env_key)
     
     # Raise error if any required keys are missing
     if missing_keys:
-        logger.error(f"Missing required API keys: {', '.join(missing_keys)}")
+        logger.error("Missing required API keys: %s", ", ".join(missing_keys))
         raise ConfigurationError(
             message=f"Missing or invalid required API keys: {', '.join(missing_keys)}",
             details={
@@ -115,10 +157,14 @@ def load_config() -> Dict[str, str]:
     return config
 
 
+@lru_cache(maxsize=None)
 def get_api_key(key_name: str) -> str:
     """
     Get a specific API key from environment variables.
     
+    Valid keys are cached per ``key_name``; use ``get_api_key.cache_clear()``
+    to pick up changes to the environment.
+    
     Args:
         key_name: Name of the API key to retrieve (e.g., 'PHIDATA_API_KEY')
     
@@ -129,7 +175,7 @@ def get_api_key(key_name: str) -> str:
         ValueError: If the specified key is not found or is invalid
     """
     value = os.getenv(key_name)
-    if not value or value.strip() == '' or 'your_' in value.lower():
+    if not _is_usable_key(value):
         raise ConfigurationError(
             message=f"API key '{key_name}' is not set or is invalid",
             details={
@@ -28,23 +28,41 @@ Example:
     >>> print(response.content)
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from phi.agent import Agent
-from phi.model.ollama import Ollama
+from model_factory import get_ollama_model
 from phi.tools.yfinance import YFinanceTools
 import yfinance as yf
 from typing import Optional
 from error_handler import AgentExecutionError, ValidationError, handle_agent_execution_error
 from logger import get_logger, log_query, log_error, log_response
+import threading
 import time
 
 # Initialize logger
 logger = get_logger("financial_agent")
 
+# Successful ticker validations, keyed by uppercased ticker.
+# Values are (is_valid, validated_at) using time.monotonic().
+_TICKER_CACHE: dict[str, tuple[bool, float]] = {}
+_TICKER_TTL = 300  # seconds
+_TICKER_CACHE_LOCK = threading.Lock()
+
+# Ticker format limits checked before any network call.
+# Besides letters and digits, allow share classes (BRK.B), crypto/FX pairs
+# (BTC-USD, EURUSD=X) and indices (^GSPC).
+_TICKER_MAX_LENGTH = 10
+_TICKER_EXTRA_CHARS = frozenset('.-^=')
+
 
 def validate_ticker(ticker: str) -> tuple[bool, Optional[str]]:
     """
     Validate if a ticker symbol exists and is valid.
     
+    Successful validations are cached for ``_TICKER_TTL`` seconds, so
+    repeated lookups of the same ticker skip the Yahoo Finance round-trip.
+    
     Args:
         ticker: Stock ticker symbol to validate
         
@@ -54,6 +72,27 @@ def validate_ticker(ticker: str) -> tuple[bool, Optional[str]]:
     Raises:
         ValidationError: If ticker validation fails
     """
+    # Fail fast on malformed symbols without calling Yahoo Finance
+    if (
+        not isinstance(ticker, str)
+        or not ticker
+        or len(ticker) > _TICKER_MAX_LENGTH
+        or not all(c.isalnum() or c in _TICKER_EXTRA_CHARS for c in ticker)
+    ):
+        raise ValidationError(
+            message=f"Invalid ticker symbol: '{ticker}'",
+            details={
+                "ticker": ticker,
+                "suggestion": "Ticker symbols are short codes such as AAPL, BRK.B or ^GSPC"
+            }
+        )
+    
+    cache_key = ticker.upper()
+    with _TICKER_CACHE_LOCK:
+        cached = _TICKER_CACHE.get(cache_key)
+    if cached is not None and time.monotonic() - cached[1] < _TICKER_TTL:
+        return cached[0], None
+    
     try:
         stock = yf.Ticker(ticker)
         # Try to fetch basic info to verify ticker exists
@@ -69,6 +108,8 @@ def validate_ticker(ticker: str) -> tuple[bool, Optional[str]]:
                 }
             )
         
+        with _TICKER_CACHE_LOCK:
+            _TICKER_CACHE[cache_key] = (True, time.monotonic())
         return True, None
     except ValidationError:
         raise
@@ -83,6 +124,34 @@ def validate_ticker(ticker: str) -> tuple[bool, Optional[str]]:
         )
 
 
+def validate_tickers(tickers: list[str]) -> dict[str, tuple[bool, Optional[str]]]:
+    """
+    Validate several ticker symbols concurrently.
+    
+    Each lookup is a network round-trip, so running them on a thread pool
+    makes the total cost roughly one round-trip instead of one per ticker.
+    Cached tickers return immediately (see ``validate_ticker``).
+    
+    Args:
+        tickers: Ticker symbols to validate (duplicates are checked once)
+        
+    Returns:
+        dict: Maps each ticker to (is_valid, error_message)
+    """
+    def _validate(ticker: str) -> tuple[bool, Optional[str]]:
+        try:
+            return validate_ticker(ticker)
+        except ValidationError as e:
+            return False, e.message
+    
+    unique_tickers = list(dict.fromkeys(tickers))
+    if not unique_tickers:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(8, len(unique_tickers))) as executor:
+        return dict(zip(unique_tickers, executor.map(_validate, unique_tickers)))
+
+
 def create_financial_agent() -> Agent:
     """
     Create and configure the Financial Agent with error handling.
@@ -113,7 +182,7 @@ def create_financial_agent() -> Agent:
     financial_agent = Agent(
         name="FinancialAgent",
         role="Fetch financial details about stocks.",
-        model=Ollama(id="llama3.2"),
+        model=get_ollama_model(),
         tools=[
             YFinanceTools(
                 analyst_recommendations=True,  # Enable analyst recommendations
@@ -151,12 +220,12 @@ def query_financial_agent(query: str, agent: Optional[Agent] = None) -> str:
         AgentExecutionError: If agent execution fails
     """
     if agent is None:
-        agent = financial_agent
+        agent = get_financial_agent()
     
     # Log the query
     log_query(logger, query, agent_name="FinancialAgent")
     
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     success = False
     
     try:
@@ -166,19 +235,22 @@ def query_financial_agent(query: str, agent: Optional[Agent] = None) -> str:
         success = True
         
         # Log successful response
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
         log_response(logger, success=True, agent_name="FinancialAgent", execution_time=execution_time)
         
         return response
     except Exception as e:
         # Log the error
-        log_error(logger, e, context={"query": query}, agent_name="FinancialAgent")
+        log_error(
+            logger, e, context={"query": query}, agent_name="FinancialAgent",
+            include_traceback=not isinstance(e, ValidationError)
+        )
         
         # Use centralized error handler
         error = handle_agent_execution_error(e, agent_name="FinancialAgent")
         
         # Log failed response
-        execution_time = time.time() - start_time
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
         log_response(logger, success=False, agent_name="FinancialAgent", execution_time=execution_time)
         
         # Format error for display
@@ -189,7 +261,24 @@ def query_financial_agent(query: str, agent: Optional[Agent] = None) -> str:
         )
 
 
-# Initialize the agent for direct import
-# This allows users to import and use the agent directly:
-# from financial_agent_module import financial_agent
-financial_agent = create_financial_agent()
+@lru_cache(maxsize=1)
+def get_financial_agent() -> Agent:
+    """
+    Get the shared Financial Agent, creating it on first use.
+    
+    Returns:
+        Agent: The process-wide financial agent instance
+    """
+    return create_financial_agent()
+
+
+def __getattr__(name: str):
+    """
+    Lazily create the module-level agent on first access (PEP 562).
+    
+    This keeps direct imports working without building the agent at import time:
+    from financial_agent_module import financial_agent
+    """
+    if name == "financial_agent":
+        return get_financial_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,25 +5,82 @@ This module provides centralized logging configuration for the Financial AI Agen
 It ensures API keys are never logged and provides structured logging for queries and errors.
 """
 
+import itertools
 import logging
 import re
 import sys
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from datetime import datetime
+from error_handler import ConfigurationError, ValidationError
+
+
+# Potential API keys or tokens in user queries:
+#   - OpenAI-style keys (sk-...), any query length
+#   - Long strings that might be keys, only possible in queries of 40+ chars
+_QUERY_KEY_PATTERN = r'sk-[a-zA-Z0-9]{20,}'
+_QUERY_LONG_TOKEN_LENGTH = 40
+_QUERY_KEY_RE = re.compile(_QUERY_KEY_PATTERN)
+_QUERY_SENSITIVE_RE = re.compile(
+    f'(?:{_QUERY_KEY_PATTERN})|(?:[a-zA-Z0-9_-]{{{_QUERY_LONG_TOKEN_LENGTH},}})'
+)
+
+# Fallback query IDs for log_query/log_response when none is given
+_QUERY_ID = itertools.count(1)
+
+# Expected control-flow errors that are logged without a traceback by default
+_NO_TRACEBACK_ERRORS = (ValidationError, ConfigurationError)
+
+# Dictionary keys containing any of these terms have their values redacted
+_SENSITIVE_KEY_TERMS = frozenset(['api_key', 'token', 'password', 'secret', 'key'])
+
+# Loggers returned by get_logger(), keyed by requested name
+_LOGGERS: Dict[Optional[str], logging.Logger] = {}
 
 
 class SensitiveDataFilter(logging.Filter):
-    """Filter to remove sensitive data (API keys) from log messages."""
+    """
+    Filter to remove sensitive data (API keys) from log messages.
+    
+    Subclasses may change SENSITIVE_PATTERNS; the combined regex is rebuilt
+    for them, and their messages skip no scan unless they set _SENTINELS:
     
-    # Patterns to detect potential API keys
-    SENSITIVE_PATTERNS = [
+    >>> class InternalFilter(SensitiveDataFilter):
+    ...     SENSITIVE_PATTERNS = SensitiveDataFilter.SENSITIVE_PATTERNS + (r'int-[0-9a-f]{8}',)
+    >>> InternalFilter()._sanitize_text("id int-0badf00d")
+    'id [REDACTED_API_KEY]'
+    >>> InternalFilter()._sanitize_text("groq_api_key=gsk_abc")
+    '[REDACTED_API_KEY]'
+    """
+    
+    # Patterns to detect potential API keys (all matched case-insensitively)
+    SENSITIVE_PATTERNS = (
         r'PHIDATA_API_KEY[=:]\s*[^\s]+',
         r'GROQ_API_KEY[=:]\s*[^\s]+',
         r'OPENAI_API_KEY[=:]\s*[^\s]+',
         r'api[_-]?key["\']?\s*[=:]\s*["\']?[a-zA-Z0-9_-]{20,}',
         r'token["\']?\s*[=:]\s*["\']?[a-zA-Z0-9_-]{20,}',
         r'sk-[a-zA-Z0-9]{20,}',  # OpenAI key pattern
-    ]
+    )
+    
+    # All patterns combined into one precompiled alternation so each message
+    # is scanned once instead of once per pattern. Case-insensitive matching
+    # is required for correctness: keys are logged as groq_api_key=..., SK-...
+    _SENSITIVE_RE = re.compile("|".join(SENSITIVE_PATTERNS), re.IGNORECASE)
+    
+    # Every pattern above needs a '='/':' separator or an 'sk-' prefix (in any
+    # case, hence 'k-'/'K-'); messages without them can skip the regex scan
+    _SENTINELS = ('=', ':', 'k-', 'K-')
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A subclass with its own patterns needs its own combined regex, and
+        # the sentinels above only hold for the default patterns ('' is in
+        # every string, so the pre-check then never skips a message)
+        if 'SENSITIVE_PATTERNS' in cls.__dict__:
+            if '_SENSITIVE_RE' not in cls.__dict__:
+                cls._SENSITIVE_RE = re.compile("|".join(cls.SENSITIVE_PATTERNS), re.IGNORECASE)
+            if '_SENTINELS' not in cls.__dict__:
+                cls._SENTINELS = ('',)
     
     def filter(self, record: logging.LogRecord) -> bool:
         """
@@ -52,19 +109,34 @@ class SensitiveDataFilter(logging.Filter):
         """
         Remove sensitive data from text.
         
+        Key names and the ``sk-`` prefix are matched in any case:
+        
+        >>> sanitize = SensitiveDataFilter()._sanitize_text
+        >>> sanitize("groq_api_key=gsk_abc")
+        '[REDACTED_API_KEY]'
+        >>> sanitize("Groq_Api_Key: abc")
+        '[REDACTED_API_KEY]'
+        >>> sanitize("phidata_api_key=phi-short")
+        '[REDACTED_API_KEY]'
+        >>> sanitize("key SK-abcdefghijklmnopqrstuvwxyz")
+        'key [REDACTED_API_KEY]'
+        
         Args:
             text: Text to sanitize
             
         Returns:
             str: Sanitized text with sensitive data replaced
         """
-        for pattern in self.SENSITIVE_PATTERNS:
-            text = re.sub(pattern, '[REDACTED_API_KEY]', text, flags=re.IGNORECASE)
-        return text
+        if not any(sentinel in text for sentinel in self._SENTINELS):
+            return text
+        return self._SENSITIVE_RE.sub('[REDACTED_API_KEY]', text)
     
     def _sanitize_value(self, value: Any) -> Any:
         """
-        Sanitize a value (recursively for dicts and lists).
+        Sanitize a value (recursively for dicts, lists and tuples).
+        
+        Strings and exact container types are checked first; subclasses of
+        the containers fall back to isinstance checks.
         
         Args:
             value: Value to sanitize
@@ -72,6 +144,16 @@ class SensitiveDataFilter(logging.Filter):
         Returns:
             Sanitized value
         """
+        value_type = type(value)
+        if value_type is str:
+            return self._sanitize_text(value)
+        if value_type is dict:
+            return {k: self._sanitize_value(v) for k, v in value.items()}
+        if value_type is list:
+            return [self._sanitize_value(item) for item in value]
+        if value_type is tuple:
+            return tuple(self._sanitize_value(item) for item in value)
+        
         if isinstance(value, str):
             return self._sanitize_text(value)
         elif isinstance(value, dict):
@@ -126,26 +208,29 @@ def setup_logging(
     Returns:
         logging.Logger: Configured logger instance
     """
+    # Resolve the level name once for the logger and all handlers
+    numeric_level = getattr(logging, level.upper())
+    
     # Create logger
     logger = logging.getLogger("financial_agent")
-    logger.setLevel(getattr(logging, level.upper()))
+    logger.setLevel(numeric_level)
     
     # Remove existing handlers
     logger.handlers.clear()
     
-    # Create formatter
+    # Create formatter (one instance shared by all handlers)
     formatter = StructuredFormatter(
         fmt='%(timestamp)s - %(name)s - %(levelname)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     
-    # Add sensitive data filter
+    # Add sensitive data filter (one instance shared by all handlers)
     sensitive_filter = SensitiveDataFilter()
     
     # Console handler
     if enable_console:
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(getattr(logging, level.upper()))
+        console_handler.setLevel(numeric_level)
         console_handler.setFormatter(formatter)
         console_handler.addFilter(sensitive_filter)
         logger.addHandler(console_handler)
@@ -153,7 +238,7 @@ def setup_logging(
     # File handler
     if log_file:
         file_handler = logging.FileHandler(log_file)
-        file_handler.setLevel(getattr(logging, level.upper()))
+        file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
         file_handler.addFilter(sensitive_filter)
         logger.addHandler(file_handler)
@@ -171,16 +256,18 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     Returns:
         logging.Logger: Logger instance
     """
-    if name:
-        return logging.getLogger(f"financial_agent.{name}")
-    return logging.getLogger("financial_agent")
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = logging.getLogger(f"financial_agent.{name}" if name else "financial_agent")
+        _LOGGERS[name] = logger
+    return logger
 
 
 def log_query(
     logger: logging.Logger,
     query: str,
     agent_name: str,
-    query_id: Optional[str] = None
+    query_id: Optional[Union[str, int]] = None
 ) -> None:
     """
     Log a query without sensitive data.
@@ -189,25 +276,30 @@ def log_query(
         logger: Logger instance
         query: User query (will be sanitized)
         agent_name: Name of the agent processing the query
-        query_id: Optional unique query identifier
+        query_id: Optional unique query identifier (defaults to a process-wide counter)
     """
+    # Skip building context and sanitizing when INFO records would be dropped
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    
     # Create extra context
     extra = {
         'agent_name': agent_name,
-        'query_id': query_id or datetime.utcnow().isoformat()
+        'query_id': query_id or next(_QUERY_ID)
     }
     
     # Sanitize query to remove potential sensitive data
     sanitized_query = _sanitize_query(query)
     
-    logger.info(f"Processing query: {sanitized_query}", extra=extra)
+    logger.info("Processing query: %s", sanitized_query, extra=extra)
 
 
 def log_error(
     logger: logging.Logger,
     error: Exception,
     context: Optional[Dict[str, Any]] = None,
-    agent_name: Optional[str] = None
+    agent_name: Optional[str] = None,
+    include_traceback: Optional[bool] = None
 ) -> None:
     """
     Log an error with context.
@@ -217,7 +309,12 @@ def log_error(
         error: Exception that occurred
         context: Optional additional context
         agent_name: Optional agent name
+        include_traceback: Whether to log the traceback. Defaults to False for
+            expected errors (ValidationError, ConfigurationError), True otherwise.
     """
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+    
     extra = {}
     if agent_name:
         extra['agent_name'] = agent_name
@@ -229,14 +326,17 @@ def log_error(
         sanitized_context = _sanitize_dict(context)
         error_msg += f" | Context: {sanitized_context}"
     
-    logger.error(error_msg, extra=extra, exc_info=True)
+    if include_traceback is None:
+        include_traceback = not isinstance(error, _NO_TRACEBACK_ERRORS)
+    
+    logger.error(error_msg, extra=extra, exc_info=include_traceback)
 
 
 def log_response(
     logger: logging.Logger,
     success: bool,
     agent_name: str,
-    query_id: Optional[str] = None,
+    query_id: Optional[Union[str, int]] = None,
     execution_time: Optional[float] = None
 ) -> None:
     """
@@ -246,12 +346,15 @@ def log_response(
         logger: Logger instance
         success: Whether the query was successful
         agent_name: Name of the agent
-        query_id: Optional query identifier
+        query_id: Optional query identifier (defaults to a process-wide counter)
         execution_time: Optional execution time in seconds
     """
+    if not logger.isEnabledFor(logging.INFO if success else logging.WARNING):
+        return
+    
     extra = {
         'agent_name': agent_name,
-        'query_id': query_id or datetime.utcnow().isoformat()
+        'query_id': query_id or next(_QUERY_ID)
     }
     
     status = "SUCCESS" if success else "FAILED"
@@ -276,41 +379,53 @@ def _sanitize_query(query: str) -> str:
     Returns:
         str: Sanitized query
     """
-    # Remove potential API keys or tokens
-    patterns = [
-        r'sk-[a-zA-Z0-9]{20,}',
-        r'[a-zA-Z0-9_-]{40,}',  # Long strings that might be keys
-    ]
-    
-    sanitized = query
-    for pattern in patterns:
-        sanitized = re.sub(pattern, '[REDACTED]', sanitized)
-    
-    return sanitized
+    # Remove potential API keys or tokens; the long-token pattern can only
+    # match queries at least _QUERY_LONG_TOKEN_LENGTH characters long
+    if len(query) >= _QUERY_LONG_TOKEN_LENGTH:
+        return _QUERY_SENSITIVE_RE.sub('[REDACTED]', query)
+    if 'sk-' in query:
+        return _QUERY_KEY_RE.sub('[REDACTED]', query)
+    return query
 
 
 def _sanitize_dict(data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Sanitize a dictionary to remove sensitive data.
     
+    Nested dictionaries are walked with an explicit stack. Dictionaries are
+    only copied when something inside them is redacted, so clean input is
+    returned as-is.
+    
     Args:
         data: Dictionary to sanitize
         
     Returns:
-        Dict: Sanitized dictionary
+        Dict: Sanitized dictionary (``data`` itself if nothing was redacted)
     """
-    sensitive_keys = ['api_key', 'token', 'password', 'secret', 'key']
+    # Each node is [source dict, sanitized copy or None, parent node, key in parent]
+    root = [data, None, None, None]
+    stack = [root]
     
-    sanitized = {}
-    for key, value in data.items():
-        # Check if key contains sensitive terms
-        if any(term in key.lower() for term in sensitive_keys):
-            sanitized[key] = '[REDACTED]'
-        elif isinstance(value, dict):
-            sanitized[key] = _sanitize_dict(value)
-        elif isinstance(value, str):
-            sanitized[key] = _sanitize_query(value)
-        else:
-            sanitized[key] = value
+    def writable(node: list) -> Dict[str, Any]:
+        # Copy a node (and, transitively, its ancestors) on first modification
+        if node[1] is None:
+            node[1] = dict(node[0])
+            if node[2] is not None:
+                writable(node[2])[node[3]] = node[1]
+        return node[1]
+    
+    while stack:
+        node = stack.pop()
+        for key, value in node[0].items():
+            # Check if key contains sensitive terms
+            key_lower = key.lower()
+            if any(term in key_lower for term in _SENSITIVE_KEY_TERMS):
+                writable(node)[key] = '[REDACTED]'
+            elif isinstance(value, dict):
+                stack.append([value, None, node, key])
+            elif isinstance(value, str):
+                sanitized = _sanitize_query(value)
+                if sanitized != value:
+                    writable(node)[key] = sanitized
     
-    return sanitized
+    return data if root[1] is None else root[1]
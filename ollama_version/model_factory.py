@@ -0,0 +1,61 @@
+"""
+Model Factory Module
+
+This module builds the Ollama models used by the agents. Every model shares one
+synchronous and one asynchronous Ollama client, so all agents reuse the same
+connection pools to the local Ollama server instead of each model creating its
+own clients.
+
+Model instances themselves are not shared: phidata registers each agent's
+tools and system prompt on its model, so every agent needs its own.
+
+Example:
+    >>> from model_factory import get_ollama_model
+    >>> agent = Agent(name="MyAgent", model=get_ollama_model())
+"""
+
+from functools import lru_cache
+from ollama import AsyncClient, Client
+from phi.model.ollama import Ollama
+from config import MODEL_ID
+
+
+@lru_cache(maxsize=1)
+def _shared_client() -> Client:
+    """
+    Get the synchronous Ollama client shared by all models (used by ``run``).
+    
+    The host is taken from the OLLAMA_HOST environment variable
+    (default: http://localhost:11434).
+    
+    Returns:
+        Client: Process-wide Ollama client
+    """
+    return Client()
+
+
+@lru_cache(maxsize=1)
+def _shared_async_client() -> AsyncClient:
+    """
+    Get the asynchronous Ollama client shared by all models (used by ``arun``,
+    e.g. in the playground).
+    
+    Without it phidata creates a new ``AsyncClient`` for every async call.
+    
+    Returns:
+        AsyncClient: Process-wide asynchronous Ollama client
+    """
+    return AsyncClient()
+
+
+def get_ollama_model(model_id: str = MODEL_ID) -> Ollama:
+    """
+    Create an Ollama model that uses the shared Ollama clients.
+    
+    Args:
+        model_id: Ollama model name (default: config.MODEL_ID)
+        
+    Returns:
+        Ollama: New model instance for a single agent
+    """
+    return Ollama(id=model_id, client=_shared_client(), async_client=_shared_async_client())
@@ -22,6 +22,11 @@ Configuration:
     - Team: Web Search Agent + Financial Agent
     - Output: Unified Markdown response
 
+For queries that need both data sources, ``parallel_multi_agent_run`` splits
+the query into sub-queries and runs both agents concurrently, so total latency
+is the slower of the two agents rather than their sum. ``financial_agent.py
+--agent multi`` runs queries this way through ``ParallelMultiAgentSystem``.
+
 Example:
     >>> from multi_agent import multi_agent_system
     >>> response = multi_agent_system.run(
@@ -30,10 +35,60 @@ Example:
     >>> print(response.content)
 """
 
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 from phi.agent import Agent
-from phi.model.ollama import Ollama
-from web_search_agent import web_search_agent
-from financial_agent_module import financial_agent
+from model_factory import get_ollama_model
+from web_search_agent import create_web_search_agent
+from financial_agent_module import create_financial_agent, validate_tickers
+from error_handler import ValidationError
+
+
+# Symbols written in an explicit ticker form: a cashtag ($AAPL) or in
+# parentheses after a company name (Apple (AAPL), Berkshire (BRK.B)).
+# Bare upper-case words are not guessed, since most of them are acronyms.
+_TICKER_CANDIDATE_RE = re.compile(
+    r"(?<![\w$])\$([A-Z]{1,5}(?:\.[A-Z])?)\b|\(([A-Z]{1,5}(?:\.[A-Z])?)\)"
+)
+
+# Finance and general acronyms that also show up in parentheses, e.g.
+# "earnings per share (EPS)"; these are never treated as tickers
+_NON_TICKER_WORDS = frozenset({
+    "AI", "API", "ARR", "AUM", "CAGR", "CAPEX", "CEO", "CFO", "COO", "CPI",
+    "CTO", "DCF", "EBIT", "EPS", "ESG", "ETF", "EU", "EV", "FCF", "FED",
+    "FOMC", "FX", "FY", "GAAP", "GDP", "IPO", "IRR", "IT", "LLM", "NAV",
+    "NPV", "OPEX", "PE", "PEG", "REIT", "ROA", "ROE", "ROI", "SEC", "TTM",
+    "UK", "US", "USA", "USD", "WACC", "YOY", "YTD",
+})
+
+
+def _candidate_tickers(query: str) -> List[str]:
+    """
+    Pick out the ticker symbols a query writes in an explicit ticker form.
+    
+    >>> _candidate_tickers("Compare $AAPL with Microsoft (MSFT) and Berkshire (BRK.B)")
+    ['AAPL', 'MSFT', 'BRK.B']
+    >>> _candidate_tickers("How do EPS, CEO pay and ETF flows in the USA affect AI stocks?")
+    []
+    >>> _candidate_tickers("Earnings per share (EPS) and return on equity (ROE) for $NVDA")
+    ['NVDA']
+    >>> _candidate_tickers("Is $5 a fair price for NVIDIA?")
+    []
+    
+    Args:
+        query: User query
+        
+    Returns:
+        List: Candidate symbols in order of first appearance, without duplicates
+    """
+    return list(dict.fromkeys(
+        symbol
+        for cashtag, parenthesized in _TICKER_CANDIDATE_RE.findall(query)
+        if (symbol := cashtag or parenthesized) not in _NON_TICKER_WORDS
+    ))
 
 
 def create_multi_agent_system() -> Agent:
@@ -55,7 +110,8 @@ def create_multi_agent_system() -> Agent:
         1. Analyze user query to determine required data sources
         2. Delegate to Financial Agent for stock data
         3. Delegate to Web Search Agent for general information
-        4. Combine results from both agents
+           (in the same step as 2 when both are needed, so they run in parallel)
+        4. Combine results from both agents once both have answered
         5. Synthesize comprehensive response
     
     Returns:
@@ -65,17 +121,20 @@ def create_multi_agent_system() -> Agent:
         >>> agent = create_multi_agent_system()
         >>> response = agent.run("NVIDIA stock analysis and AI market trends")
     """
+    # The team gets its own member agents: phidata keeps per-run state on each
+    # Agent, so members must not be shared with the standalone agents
     multi_agent = Agent(
         name="MultiAgentSystem",
-        team=[web_search_agent, financial_agent],  # Specialized agents in the team
-        model=Ollama(id="llama3.2"),
+        team=[create_web_search_agent(), create_financial_agent()],  # Specialized agents in the team
+        model=get_ollama_model(),
         instructions=[
             "Coordinate between the Web Search Agent and Financial Agent to answer user queries",
             "Combine data from all agents into a unified response",
             "Summarize insights from multiple sources",
             "When a query requires financial data, delegate to the Financial Agent",
             "When a query requires web search, delegate to the Web Search Agent",
-            "When a query requires both, coordinate both agents and synthesize the results",
+            "When a query requires both, delegate to both agents in the same step so their tasks can run in parallel",
+            "Only synthesize the results after both agents have returned their answers",
             "Always provide comprehensive and well-structured responses",
             "Include relevant context from all data sources"
         ],
@@ -86,7 +145,207 @@ def create_multi_agent_system() -> Agent:
     return multi_agent
 
 
-# Initialize the multi-agent system for direct import
-# This allows users to import and use the system directly:
-# from multi_agent import multi_agent_system
-multi_agent_system = create_multi_agent_system()
+def create_coordinator_agent() -> Agent:
+    """
+    Create a team-less agent that splits queries and merges sub-answers.
+    
+    Used by ``parallel_multi_agent_run`` to decompose a query into independent
+    financial and web sub-queries, and to synthesize the agents' answers.
+    
+    Returns:
+        Agent: Coordinator agent without tools or team members
+    """
+    return Agent(
+        name="MultiAgentCoordinator",
+        model=get_ollama_model(),
+        instructions=[
+            "Follow the requested output format exactly",
+            "Combine data from all agents into a unified response",
+            "Include relevant context from all data sources"
+        ],
+        markdown=True
+    )
+
+
+def run_in_parallel(tasks: Sequence[Tuple[Agent, str]]) -> List[Any]:
+    """
+    Run each (agent, query) pair concurrently.
+    
+    Agent runs are network-bound (LLM and tool calls), so threads overlap
+    them well. Each agent should appear at most once and must not be shared
+    with other callers, since phidata agents keep per-run state.
+    
+    Args:
+        tasks: Sequence of (agent, query) pairs
+        
+    Returns:
+        List: Agent responses, in the same order as ``tasks``
+        
+    Raises:
+        Exception: Re-raises the first failure from any agent run
+    """
+    if not tasks:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+        futures = [executor.submit(agent.run, query) for agent, query in tasks]
+        return [future.result() for future in futures]
+
+
+def _decompose_query(coordinator: Agent, query: str) -> Dict[str, str]:
+    """
+    Ask the coordinator to split a query into financial and web sub-queries.
+    
+    Falls back to sending the full query to both agents if the reply
+    cannot be parsed.
+    
+    Args:
+        coordinator: Coordinator agent from ``create_coordinator_agent``
+        query: User query
+        
+    Returns:
+        Dict: Sub-queries keyed by "financial" and "web" (empty if not needed)
+    """
+    response = coordinator.run(
+        "Split the user query below into independent sub-queries for a Financial Agent "
+        "(stock prices, analyst recommendations, fundamentals) and a Web Search Agent "
+        "(news and general information). Reply with JSON only, in the form "
+        '{"financial": "...", "web": "..."}, using an empty string for an agent '
+        "that is not needed.\n\n"
+        f"Query: {query}"
+    )
+    content = str(getattr(response, "content", response))
+    
+    try:
+        subtasks = json.loads(re.search(r"\{.*\}", content, re.DOTALL).group(0))
+        result = {key: str(subtasks.get(key) or "").strip() for key in ("financial", "web")}
+    except (AttributeError, TypeError, ValueError):
+        result = {}
+    
+    if not any(result.values()):
+        return {"financial": query, "web": query}
+    return result
+
+
+def parallel_multi_agent_run(query: str, tickers: Optional[Sequence[str]] = None) -> Any:
+    """
+    Answer a query by running the Financial and Web Search agents in parallel.
+    
+    The coordinator splits the query, the needed agents run concurrently,
+    and the coordinator synthesizes their answers into one response.
+    
+    Ticker symbols are validated concurrently while the query is being
+    split, and invalid ones are flagged in the financial sub-query. When
+    ``tickers`` are given explicitly, the query fails fast if none of them
+    are valid. Otherwise symbols the query writes as $AAPL or (AAPL) are
+    checked. Those are picked out of free text, so they never fail the
+    query.
+    
+    Args:
+        query: User query
+        tickers: Ticker symbols mentioned in the query (default: picked
+            out of the query text)
+        
+    Returns:
+        Coordinator response with the synthesized answer
+        
+    Raises:
+        ValidationError: If tickers were given explicitly and none of them
+            are valid
+        
+    Example:
+        >>> response = parallel_multi_agent_run(
+        ...     "Compare AAPL and MSFT analyst recommendations", tickers=["AAPL", "MSFT"]
+        ... )
+        >>> print(response.content)
+    """
+    coordinator = create_coordinator_agent()
+    
+    strict = tickers is not None
+    if tickers is None:
+        tickers = _candidate_tickers(query)
+    
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        validation = executor.submit(validate_tickers, list(tickers)) if tickers else None
+        subtasks = _decompose_query(coordinator, query)
+        ticker_status = validation.result() if validation else {}
+    
+    invalid_tickers = [ticker for ticker, (is_valid, _) in ticker_status.items() if not is_valid]
+    if strict and invalid_tickers and len(invalid_tickers) == len(ticker_status):
+        raise ValidationError(
+            message=f"Invalid ticker symbol(s): {', '.join(invalid_tickers)}",
+            details={
+                "tickers": {ticker: error for ticker, (_, error) in ticker_status.items()},
+                "suggestion": "Please verify the ticker symbols and try again"
+            }
+        )
+    if invalid_tickers and subtasks.get("financial"):
+        subtasks["financial"] += (
+            f"\n\nIgnore these invalid ticker symbols: {', '.join(invalid_tickers)}"
+        )
+    
+    # Fresh agents per call: the shared ones may be running another query
+    tasks = []
+    if subtasks.get("financial"):
+        tasks.append((create_financial_agent(), subtasks["financial"]))
+    if subtasks.get("web"):
+        tasks.append((create_web_search_agent(), subtasks["web"]))
+    
+    responses = run_in_parallel(tasks)
+    findings = "\n\n".join(
+        f"## {agent.name}\n{getattr(response, 'content', response)}"
+        for (agent, _), response in zip(tasks, responses)
+    )
+    
+    return coordinator.run(
+        "Using the agent findings below, write a unified, well-structured answer "
+        "to the user query.\n\n"
+        f"Query: {query}\n\n{findings}"
+    )
+
+
+class ParallelMultiAgentSystem:
+    """
+    Multi-Agent System that answers queries with ``parallel_multi_agent_run``.
+    
+    Offers the ``run`` method of a phidata Agent, so it can stand in for the
+    team agent wherever queries are routed by agent. Every run builds its own
+    agents, so one instance can serve concurrent queries.
+    """
+    
+    name = "MultiAgentSystem"
+    
+    def run(self, query: str) -> Any:
+        """
+        Answer a query with the Financial and Web Search agents in parallel.
+        
+        Args:
+            query: User query
+            
+        Returns:
+            Coordinator response with the synthesized answer
+        """
+        return parallel_multi_agent_run(query)
+
+
+@lru_cache(maxsize=1)
+def get_multi_agent_system() -> Agent:
+    """
+    Get the shared Multi-Agent System, creating it on first use.
+    
+    Returns:
+        Agent: The process-wide multi-agent system instance
+    """
+    return create_multi_agent_system()
+
+
+def __getattr__(name: str):
+    """
+    Lazily create the module-level system on first access (PEP 562).
+    
+    This keeps direct imports working without building the agents at import time:
+    from multi_agent import multi_agent_system
+    """
+    if name == "multi_agent_system":
+        return get_multi_agent_system()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
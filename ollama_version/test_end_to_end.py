@@ -13,72 +13,508 @@ Requirements tested:
 """
 
 import os
+import re
 import sys
+import json
+import argparse
+import asyncio
 import subprocess
+import threading
 import time
-from typing import Dict, List, Tuple
+import urllib.request
+from concurrent.futures import Future
+from functools import cached_property
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import urlsplit
+
+# Separator lines for headers and sections
+_HLINE_EQ = "=" * 80
+_HLINE_DASH = "─" * 80
+
+# Optional on-disk cache of query results between runs, enabled with
+# --use-cache (pip install diskcache)
+try:
+    from diskcache import Cache
+except ImportError:
+    Cache = None
+
+# Directory and lifetime (seconds) of cached query results
+_CACHE_DIR = '.test_cache'
+_CACHE_EXPIRE = 3600
+
+# Start of the agent's answer in financial_agent.py output. Success tokens
+# are only looked for after it, since the echoed query often contains them.
+_RESPONSE_MARKER = b'[response]:'
 
 
 class TestResult:
     """Container for test execution results."""
     
-    def __init__(self, test_name: str, passed: bool, message: str, details: str = ""):
+    def __init__(
+        self,
+        test_name: str,
+        passed: bool,
+        message: str,
+        details: str = "",
+        skipped: bool = False
+    ):
         self.test_name = test_name
         self.passed = passed
         self.message = message
         self.details = details
+        self.skipped = skipped
+        self._str_cache: Optional[str] = None
     
     def __str__(self):
-        status = "[+] PASS" if self.passed else "[-] FAIL"
-        result = f"{status}: {self.test_name}\n  {self.message}"
-        if self.details:
-            result += f"\n  Details: {self.details}"
-        return result
+        # Formatted once: each result prints as it completes and again in the summary
+        if self._str_cache is None:
+            if self.skipped:
+                status = "[!] SKIP"
+            else:
+                status = "[+] PASS" if self.passed else "[-] FAIL"
+            result = f"{status}: {self.test_name}\n  {self.message}"
+            if self.details:
+                result += f"\n  Details: {self.details}"
+            self._str_cache = result
+        return self._str_cache
+
+
+class Deadline:
+    """Shared wall-clock budget for a group of operations."""
+    
+    def __init__(self, total: float):
+        """
+        Start the budget.
+        
+        Args:
+            total: Seconds available from now
+        """
+        self.end = time.monotonic() + total
+    
+    def remaining(self) -> float:
+        """Seconds left before the deadline (0.0 once it has passed)."""
+        return max(0.0, self.end - time.monotonic())
+
+
+def _model_base_url() -> str:
+    """Base URL of the Ollama server the agents call (OLLAMA_HOST, as in the Ollama client)."""
+    host = os.environ.get('OLLAMA_HOST', 'http://localhost:11434')
+    if '://' not in host:
+        host = f"http://{host}"
+    return host.rstrip('/')
+
+
+async def _model_host_reachable() -> bool:
+    """
+    Check whether a TCP connection to the model host can be opened.
+    
+    Returns:
+        bool: False if the host cannot be resolved, refuses the connection
+            or does not answer within _PROBE_TIMEOUT seconds
+    """
+    url = urlsplit(_model_base_url())
+    port = url.port or (443 if url.scheme == 'https' else 80)
+    try:
+        async with asyncio.timeout(_PROBE_TIMEOUT):
+            _, writer = await asyncio.open_connection(url.hostname, port)
+    except (OSError, TimeoutError, ValueError):
+        return False
+    writer.close()
+    return True
+
+
+def _preview(data: bytes, limit: int = 200) -> str:
+    """Decode the first ``limit`` bytes of captured output for display."""
+    return data[:limit].decode('utf-8', errors='replace')
+
+
+def _run_in_daemon_thread(func, *args) -> Future:
+    """
+    Call ``func(*args)`` on a daemon thread and return a Future for its result.
+    
+    In-process queries run on these threads instead of ``asyncio.to_thread``:
+    the default executor is joined when ``asyncio.run`` returns and again at
+    interpreter exit, so a query still hanging after its timeout would hold
+    up the end of the run. A daemon thread is simply abandoned.
+    
+    Args:
+        func: Callable to run
+        *args: Positional arguments for func
+        
+    Returns:
+        Future: Resolves to the call's return value or exception
+    """
+    future = Future()
+    
+    def target():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    threading.Thread(target=target, daemon=True).start()
+    return future
+
+
+async def _run_with_early_exit(
+    cmd: List[str],
+    timeout: float,
+    success_tokens: Sequence[bytes] = ()
+) -> Tuple[int, bytes, bytes]:
+    """
+    Run a command, stopping it as soon as its answer contains every token.
+    
+    stdout and stderr are drained as they are written, so a chatty child
+    cannot block on a full pipe, and many commands share one event loop.
+    Once every (lowercase) success token has appeared after the response
+    marker the child is terminated and treated as successful, skipping the
+    rest of its run.
+    
+    Args:
+        cmd: Command to run
+        timeout: Seconds to wait for the command
+        success_tokens: Lowercase byte strings that signal success
+        
+    Returns:
+        Tuple of (exit code, stdout, stderr)
+        
+    Raises:
+        subprocess.TimeoutExpired: If the command does not finish in time
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    stdout = bytearray()
+    lowered = bytearray()  # Lowercase copy of stdout, extended chunk by chunk
+    pending = set(success_tokens)
+    token_overlap = max(map(len, success_tokens), default=1) - 1
+    
+    async def read_stdout() -> bool:
+        """Read stdout until EOF; return True once every success token is seen."""
+        marker = -1
+        while chunk := await proc.stdout.read(65536):
+            stdout.extend(chunk)
+            if not success_tokens:
+                continue
+            
+            # Only the new chunk is scanned, starting far enough back to
+            # catch a marker or token split across two chunks
+            start = len(lowered)
+            lowered.extend(chunk.lower())
+            if marker < 0:
+                marker = lowered.find(_RESPONSE_MARKER, max(0, start - len(_RESPONSE_MARKER) + 1))
+                if marker < 0:
+                    continue
+                scan_from = marker
+            else:
+                scan_from = max(marker, start - token_overlap)
+            
+            pending.difference_update([token for token in pending if lowered.find(token, scan_from) >= 0])
+            if not pending:
+                return True
+        return False
+    
+    stderr_task = asyncio.create_task(proc.stderr.read())
+    try:
+        async with asyncio.timeout(timeout):
+            succeeded = await read_stdout()
+            if succeeded:
+                proc.terminate()
+            returncode = await proc.wait()
+            stderr = await stderr_task
+    except TimeoutError:
+        proc.kill()
+        await proc.wait()
+        stderr_task.cancel()
+        raise subprocess.TimeoutExpired(cmd, timeout) from None
+    except asyncio.CancelledError:
+        # The test was skipped; don't leave the child running
+        proc.kill()
+        await proc.wait()
+        stderr_task.cancel()
+        raise
+    
+    return (0 if succeeded else returncode), bytes(stdout), stderr
+
+
+# Case-insensitive patterns the validators look for in raw query output;
+# searching the bytes directly avoids building a lowercased copy
+_AAPL_RE = re.compile(rb'aapl', re.IGNORECASE)
+_PRICE_RE = re.compile(rb'price|\$', re.IGNORECASE)
+_AI_RE = re.compile(rb'artificial intelligence|\bai\b', re.IGNORECASE)
+_NVIDIA_RE = re.compile(rb'nvidia|nvda', re.IGNORECASE)
+_ERROR_RE = re.compile(rb'error|invalid|not found', re.IGNORECASE)
+
+# Output of a query that failed on the network. The agents report any
+# connection, timeout or network failure with the same message (a single
+# web search timeout included), so this only prompts a check of the model
+# host; see EndToEndValidator._model_unreachable.
+_NETWORK_FAILURE_RE = re.compile(
+    rb'connection refused|connecterror|failed to connect|network error occurred',
+    re.IGNORECASE
+)
+
+# Seconds to wait for a TCP connection to the model host
+_PROBE_TIMEOUT = 5
+
+
+# Validators take (returncode, stdout, stderr) and return the result message
+# for a passing test, or None if the test failed
+
+
+def _check_financial(returncode: int, stdout: bytes, stderr: bytes) -> Optional[str]:
+    """Expect an answer mentioning AAPL and a price."""
+    if returncode == 0 and _AAPL_RE.search(stdout) and _PRICE_RE.search(stdout):
+        return "Successfully retrieved AAPL stock price"
+    return None
+
+
+def _check_web_search(returncode: int, stdout: bytes, stderr: bytes) -> Optional[str]:
+    """Expect an answer about artificial intelligence."""
+    if returncode == 0 and _AI_RE.search(stdout):
+        return "Successfully performed web search"
+    return None
+
+
+def _check_multi_agent(returncode: int, stdout: bytes, stderr: bytes) -> Optional[str]:
+    """Expect an answer about NVIDIA."""
+    if returncode == 0 and _NVIDIA_RE.search(stdout):
+        return "Successfully executed multi-agent query"
+    return None
+
+
+def _check_invalid_ticker(returncode: int, stdout: bytes, stderr: bytes) -> Optional[str]:
+    """
+    Expect the invalid ticker to be handled.
+    
+    Either an error message (with any exit code), or a successful run where
+    the agent explains that it could not find the ticker.
+    """
+    # Search each stream separately: no concatenated copy, and stderr is
+    # only scanned when stdout has no error message
+    if _ERROR_RE.search(stdout) or _ERROR_RE.search(stderr):
+        return "Properly handled invalid ticker with error message"
+    if returncode == 0:
+        # Agent might return a message saying it couldn't find the ticker
+        return "Query completed (agent may have handled invalid ticker gracefully)"
+    return None
+
+
+class LocalTest(NamedTuple):
+    """Definition of one local-script query test."""
+    name: str                                      # Name shown in results
+    label: str                                     # Short label for plan and progress output
+    query: str                                     # Query sent to financial_agent.py
+    agent: str                                     # 'financial', 'web' or 'multi'
+    timeout: int                                   # Seconds to wait for the query
+    success_tokens: Tuple[bytes, ...]              # Tokens that end a subprocess run early
+    # (returncode, stdout, stderr) -> result message if passed, None if failed
+    validate: Callable[[int, bytes, bytes], Optional[str]]
 
 
 class EndToEndValidator:
     """Validates the Financial AI Agent System end-to-end."""
     
-    def __init__(self):
+    # Files that must exist in the working directory to run the tests
+    REQUIRED_FILES = (
+        'financial_agent.py',
+        'playground.py',
+        'config.py',
+        'multi_agent.py',
+        'web_search_agent.py',
+        'financial_agent_module.py',
+        'model_factory.py'
+    )
+    
+    # Local-script query tests; independent of each other, run concurrently
+    LOCAL_TESTS = (
+        LocalTest(
+            name="Local Script - Financial Query (AAPL price)",
+            label="Financial Query",
+            query="What is the current price of AAPL?",
+            agent='financial',
+            timeout=60,
+            success_tokens=(b'aapl', b'$'),
+            validate=_check_financial
+        ),
+        LocalTest(
+            name="Local Script - Web Search Query (AI news)",
+            label="Web Search Query",
+            query="Latest news about artificial intelligence",
+            agent='web',
+            timeout=60,
+            success_tokens=(b'artificial intelligence',),
+            validate=_check_web_search
+        ),
+        LocalTest(
+            name="Local Script - Multi-Agent Query (NVIDIA analysis)",
+            label="Multi-Agent Query",
+            query="Summarize analyst recommendations and latest news for NVIDIA",
+            agent='multi',
+            timeout=90,
+            success_tokens=(b'nvidia',),
+            validate=_check_multi_agent
+        ),
+        LocalTest(
+            name="Local Script - Invalid Ticker Error Handling",
+            label="Invalid Ticker Error Handling",
+            query="Get stock data for INVALID_TICKER",
+            agent='financial',
+            timeout=60,
+            success_tokens=(),
+            validate=_check_invalid_ticker
+        ),
+    )
+    
+    def __init__(
+        self,
+        use_subprocess: bool = False,
+        total_timeout: float = 180,
+        use_cache: bool = False
+    ):
+        """
+        Initialize the validator.
+        
+        Args:
+            use_subprocess: Run each query in a separate ``python
+                financial_agent.py`` process instead of in-process
+            total_timeout: Seconds all query tests together may take; each
+                query's own timeout is capped by what is left of it
+            use_cache: Reuse successful query results from earlier runs
+                (requires diskcache)
+        """
         self.results: List[TestResult] = []
-        self.env_file_exists = os.path.exists('.env')
+        self.use_subprocess = use_subprocess
+        self.total_timeout = total_timeout
+        self._deadline: Optional[Deadline] = None
+        self._query_tasks: List[asyncio.Task] = []
+        self._host_probe: Optional[asyncio.Task] = None
+        
+        # With use_cache, successful query results are reused across runs
+        # while the source is unchanged
+        if use_cache and Cache is None:
+            print("[!] diskcache is not installed; running without the query cache")
+        self._cache = Cache(_CACHE_DIR) if use_cache and Cache is not None else None
+        
+        # Imported by run_local_tests, once the prerequisites have passed
+        self._agent_module = None
+    
+    def _emit(self, *lines: str):
+        """Write a block of lines to stdout with a single write call."""
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     def print_header(self, text: str):
         """Print formatted header."""
-        print("\n" + "=" * 80)
-        print(f"  {text}")
-        print("=" * 80)
+        self._emit("", _HLINE_EQ, f"  {text}", _HLINE_EQ)
     
     def print_section(self, text: str):
         """Print formatted section header."""
-        print(f"\n{'─' * 80}")
-        print(f"  {text}")
-        print(f"{'─' * 80}")
+        self._emit("", _HLINE_DASH, f"  {text}", _HLINE_DASH)
+    
+    @cached_property
+    def _source_version(self) -> float:
+        """Latest modification time of the agent sources, for cache keys."""
+        return max(os.path.getmtime(f) for f in self.REQUIRED_FILES if f.endswith('.py'))
+    
+    async def _run_query(
+        self,
+        query: str,
+        agent: str,
+        timeout: float,
+        success_tokens: Sequence[bytes] = ()
+    ) -> Tuple[int, bytes, bytes, bool]:
+        """
+        Run a query through the local script, reusing a cached result if any.
+        
+        Only successful runs (exit code 0) are cached, so failures caused by
+        the network or an unavailable model are always retried.
+        
+        Args:
+            query: Query to execute
+            agent: Agent type ('financial', 'web' or 'multi')
+            timeout: Seconds to wait for the query
+            success_tokens: Lowercase byte strings that let a subprocess
+                query stop early (see _run_with_early_exit)
+            
+        Returns:
+            Tuple of (exit code, stdout, stderr, cached), with output as raw
+            bytes; cached is True if the result came from the cache
+        """
+        if self._cache is None:
+            return *await self._invoke_query(query, agent, timeout, success_tokens), False
+        
+        key = (query, agent, self.use_subprocess, self._source_version)
+        result = self._cache.get(key)
+        if result is not None:
+            return *result, True
+        
+        result = await self._invoke_query(query, agent, timeout, success_tokens)
+        if result[0] == 0:
+            self._cache.set(key, result, expire=_CACHE_EXPIRE)
+        return *result, False
+    
+    async def _invoke_query(
+        self,
+        query: str,
+        agent: str,
+        timeout: float,
+        success_tokens: Sequence[bytes] = ()
+    ) -> Tuple[int, bytes, bytes]:
+        """
+        Run a query through the local script.
+        
+        Args:
+            query: Query to execute
+            agent: Agent type ('financial', 'web' or 'multi')
+            timeout: Seconds to wait for the query
+            success_tokens: Tokens that end a subprocess query early
+            
+        Returns:
+            Tuple of (exit code, stdout, stderr)
+            
+        Raises:
+            subprocess.TimeoutExpired: If a subprocess query times out
+            TimeoutError: If an in-process query times out
+        """
+        if self.use_subprocess:
+            returncode, stdout, stderr = await _run_with_early_exit(
+                # Same interpreter as the tests; -u so the answer reaches the
+                # pipe as it is printed, not when the child exits
+                [sys.executable, '-u', 'financial_agent.py', '--query', query, '--agent', agent],
+                timeout,
+                success_tokens
+            )
+            return returncode, stdout, stderr
+        
+        future = _run_in_daemon_thread(self._agent_module.run_query, query, agent)
+        returncode, stdout, stderr = await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+        # Match the subprocess backend: validators only ever see bytes
+        return returncode, stdout.encode('utf-8', errors='replace'), stderr.encode('utf-8', errors='replace')
     
     def check_prerequisites(self) -> bool:
         """Check if prerequisites are met for testing."""
         self.print_section("Checking Prerequisites")
         
+        # List the working directory once instead of stat-ing each file;
+        # DirEntry.is_file() uses the type returned by the listing itself
+        with os.scandir('.') as entries:
+            present = {entry.name for entry in entries if entry.is_file()}
+        
         # Check .env file
-        if not self.env_file_exists:
-            print("[-] .env file not found")
-            print("   Please create .env file with valid API keys to run tests")
-            print("   Use .env.example as template")
+        if '.env' not in present:
+            self._emit(
+                "[-] .env file not found",
+                "   Please create .env file with valid API keys to run tests",
+                "   Use .env.example as template"
+            )
             return False
         
         print("[+] .env file exists")
         
         # Check required modules
-        required_files = [
-            'financial_agent.py',
-            'playground.py',
-            'config.py',
-            'multi_agent.py',
-            'web_search_agent.py',
-            'financial_agent_module.py'
-        ]
-        
-        missing_files = [f for f in required_files if not os.path.exists(f)]
+        missing_files = [f for f in self.REQUIRED_FILES if f not in present]
         if missing_files:
             print(f"[-] Missing required files: {', '.join(missing_files)}")
             return False
@@ -86,181 +522,119 @@ class EndToEndValidator:
         print("[+] All required modules present")
         return True
     
-    def test_local_financial_query(self) -> TestResult:
-        """Test financial query: 'What is the current price of AAPL?'"""
-        test_name = "Local Script - Financial Query (AAPL price)"
-        query = "What is the current price of AAPL?"
+    def warmup_model(self):
+        """
+        Load the Ollama model before the tests start.
         
-        try:
-            result = subprocess.run(
-                ['python', 'financial_agent.py', '--query', query, '--agent', 'financial'],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                # Check if response contains expected elements
-                output = result.stdout.lower()
-                if 'aapl' in output and ('price' in output or '$' in output):
-                    return TestResult(
-                        test_name,
-                        True,
-                        "Successfully retrieved AAPL stock price",
-                        f"Exit code: {result.returncode}"
-                    )
-                else:
-                    return TestResult(
-                        test_name,
-                        False,
-                        "Query executed but response format unexpected",
-                        f"Output: {result.stdout[:200]}"
-                    )
-            else:
-                # Combine stdout and stderr for better error visibility
-                error_output = result.stderr if result.stderr else result.stdout
-                return TestResult(
-                    test_name,
-                    False,
-                    f"Query failed with exit code {result.returncode}",
-                    f"Error: {error_output[:500]}"
-                )
+        The first request to a cold Ollama server pays several seconds to
+        load the model weights; concurrent first requests all wait on that
+        load. An empty prompt loads the model without generating anything,
+        so the tests see steady-state latency. Failures are reported but not
+        fatal, since the tests surface connection problems themselves.
+        """
+        from config import MODEL_ID
         
-        except subprocess.TimeoutExpired:
-            return TestResult(test_name, False, "Query timed out after 60 seconds")
-        except Exception as e:
-            return TestResult(test_name, False, f"Exception occurred: {str(e)}")
-    
-    def test_local_web_search_query(self) -> TestResult:
-        """Test web search query: 'Latest news about artificial intelligence'"""
-        test_name = "Local Script - Web Search Query (AI news)"
-        query = "Latest news about artificial intelligence"
+        request = urllib.request.Request(
+            f"{_model_base_url()}/api/generate",
+            data=json.dumps({"model": MODEL_ID, "prompt": "", "stream": False}).encode('utf-8'),
+            headers={"Content-Type": "application/json"}
+        )
         
+        print(f"\n[*] Loading Ollama model '{MODEL_ID}'...")
         try:
-            result = subprocess.run(
-                ['python', 'financial_agent.py', '--query', query, '--agent', 'web'],
-                capture_output=True,
-                text=True,
-                timeout=60
-            )
-            
-            if result.returncode == 0:
-                output = result.stdout.lower()
-                # Check for markdown formatting and sources
-                if ('artificial intelligence' in output or 'ai' in output):
-                    return TestResult(
-                        test_name,
-                        True,
-                        "Successfully performed web search",
-                        f"Exit code: {result.returncode}"
-                    )
-                else:
-                    return TestResult(
-                        test_name,
-                        False,
-                        "Query executed but response format unexpected",
-                        f"Output: {result.stdout[:200]}"
-                    )
-            else:
-                return TestResult(
-                    test_name,
-                    False,
-                    f"Query failed with exit code {result.returncode}",
-                    f"Error: {result.stderr[:200]}"
-                )
-        
-        except subprocess.TimeoutExpired:
-            return TestResult(test_name, False, "Query timed out after 60 seconds")
-        except Exception as e:
-            return TestResult(test_name, False, f"Exception occurred: {str(e)}")
+            with urllib.request.urlopen(request, timeout=120) as response:
+                response.read()
+            print("[+] Model loaded")
+        except (OSError, ValueError) as e:
+            print(f"[!] Model warmup failed: {e}")
     
-    def test_local_combined_query(self) -> TestResult:
-        """Test combined query: 'Summarize analyst recommendations and latest news for NVIDIA'"""
-        test_name = "Local Script - Multi-Agent Query (NVIDIA analysis)"
-        query = "Summarize analyst recommendations and latest news for NVIDIA"
+    async def _execute(self, test: LocalTest) -> TestResult:
+        """
+        Run one local-script query test.
         
-        try:
-            result = subprocess.run(
-                ['python', 'financial_agent.py', '--query', query, '--agent', 'multi'],
-                capture_output=True,
-                text=True,
-                timeout=90
-            )
+        Args:
+            test: Test definition from LOCAL_TESTS
             
-            if result.returncode == 0:
-                output = result.stdout.lower()
-                if 'nvidia' in output or 'nvda' in output:
-                    return TestResult(
-                        test_name,
-                        True,
-                        "Successfully executed multi-agent query",
-                        f"Exit code: {result.returncode}"
-                    )
-                else:
-                    return TestResult(
-                        test_name,
-                        False,
-                        "Query executed but response format unexpected",
-                        f"Output: {result.stdout[:200]}"
-                    )
-            else:
-                return TestResult(
-                    test_name,
-                    False,
-                    f"Query failed with exit code {result.returncode}",
-                    f"Error: {result.stderr[:200]}"
-                )
+        Returns:
+            TestResult for the test
+        """
+        # A query never gets more time than is left of the suite budget
+        remaining = self._deadline.remaining()
+        if remaining == 0:
+            return TestResult(test.name, False, "Timeout (suite deadline exceeded)")
+        timeout = min(test.timeout, remaining)
         
-        except subprocess.TimeoutExpired:
-            return TestResult(test_name, False, "Query timed out after 90 seconds")
+        try:
+            returncode, stdout, stderr, cached = await self._run_query(
+                test.query, test.agent, timeout, test.success_tokens
+            )
+        except (subprocess.TimeoutExpired, TimeoutError):
+            if timeout < test.timeout:
+                return TestResult(test.name, False, "Timeout (suite deadline exceeded)")
+            return TestResult(test.name, False, f"Query timed out after {test.timeout} seconds")
         except Exception as e:
-            return TestResult(test_name, False, f"Exception occurred: {str(e)}")
-    
-    def test_local_invalid_ticker(self) -> TestResult:
-        """Test invalid ticker: 'Get stock data for INVALID_TICKER'"""
-        test_name = "Local Script - Invalid Ticker Error Handling"
-        query = "Get stock data for INVALID_TICKER"
+            network_failure = (
+                isinstance(e, ConnectionError)
+                or _NETWORK_FAILURE_RE.search(str(e).encode('utf-8', errors='replace'))
+            )
+            if network_failure and await self._model_unreachable():
+                self._skip_pending_queries()
+            return TestResult(test.name, False, f"Exception occurred: {str(e)}")
         
-        try:
-            result = subprocess.run(
-                ['python', 'financial_agent.py', '--query', query, '--agent', 'financial'],
-                capture_output=True,
-                text=True,
-                timeout=60
+        pass_message = test.validate(returncode, stdout, stderr)
+        passed = pass_message is not None
+        network_failure = _NETWORK_FAILURE_RE.search(stdout) or _NETWORK_FAILURE_RE.search(stderr)
+        if not passed and network_failure and await self._model_unreachable():
+            self._skip_pending_queries()
+        
+        # Cache hits made no live query; only successful runs are cached
+        source = " (cached result)" if cached else ""
+        if passed:
+            return TestResult(test.name, True, pass_message, f"Exit code: {returncode}{source}")
+        elif returncode == 0:
+            return TestResult(
+                test.name,
+                False,
+                "Query executed but response format unexpected",
+                f"Output: {_preview(stdout)}{source}"
             )
-            
-            # For invalid ticker, we expect either:
-            # 1. Graceful error handling (exit code 0 with error message)
-            # 2. Or exit code 1 with proper error message
-            output = result.stdout.lower() + result.stderr.lower()
-            
-            if 'error' in output or 'invalid' in output or 'not found' in output:
-                return TestResult(
-                    test_name,
-                    True,
-                    "Properly handled invalid ticker with error message",
-                    f"Exit code: {result.returncode}"
-                )
-            elif result.returncode == 0:
-                # Agent might return a message saying it couldn't find the ticker
-                return TestResult(
-                    test_name,
-                    True,
-                    "Query completed (agent may have handled invalid ticker gracefully)",
-                    f"Output: {result.stdout[:200]}"
-                )
-            else:
-                return TestResult(
-                    test_name,
-                    False,
-                    "Unexpected response for invalid ticker",
-                    f"Output: {output[:200]}"
-                )
+        else:
+            # Prefer stderr for the failure details, falling back to stdout
+            return TestResult(
+                test.name,
+                False,
+                f"Query failed with exit code {returncode}",
+                f"Error: {_preview(stderr or stdout, 500)}"
+            )
+    
+    async def _model_unreachable(self) -> bool:
+        """
+        Check whether the model host is down, probing it at most once per run.
         
-        except subprocess.TimeoutExpired:
-            return TestResult(test_name, False, "Query timed out after 60 seconds")
-        except Exception as e:
-            return TestResult(test_name, False, f"Exception occurred: {str(e)}")
+        A network failure in one query may just be a slow web search, so the
+        other queries are only skipped once the model host itself cannot be
+        reached.
+        
+        Returns:
+            bool: True if the model host is unreachable
+        """
+        if self._host_probe is None:
+            self._host_probe = asyncio.create_task(_model_host_reachable())
+        # Shielded so a query cancelled while waiting does not cancel the
+        # probe the other queries share
+        return not await asyncio.shield(self._host_probe)
+    
+    def _skip_pending_queries(self):
+        """
+        Cancel the query tests that are still running.
+        
+        Called when the model host is unreachable, so the remaining queries
+        are skipped instead of each waiting out its timeout.
+        """
+        current = asyncio.current_task()
+        for task in self._query_tasks:
+            if task is not current:
+                task.cancel()
     
     def test_response_formatting(self) -> TestResult:
         """Verify all responses are properly formatted."""
@@ -283,75 +657,104 @@ class EndToEndValidator:
                 f"Only {len(passed_tests)} queries succeeded, expected at least 3"
             )
     
-    def run_local_tests(self):
+    async def run_local_tests(self):
         """Run all local script tests."""
-        self.print_section("Task 10.1: Testing Local Script with Real Queries")
+        # Import the agent script only now: it pulls in phidata and the model
+        # clients, which a failed prerequisite check never needs. Every
+        # in-process query then reuses its modules and shared clients.
+        if not self.use_subprocess and self._agent_module is None:
+            import financial_agent
+            self._agent_module = financial_agent
         
-        print("\n[*] Test Plan:")
-        print("  1. Financial query: 'What is the current price of AAPL?'")
-        print("  2. Web search query: 'Latest news about artificial intelligence'")
-        print("  3. Combined query: 'Summarize analyst recommendations and latest news for NVIDIA'")
-        print("  4. Invalid ticker: 'Get stock data for INVALID_TICKER'")
-        print("  5. Verify response formatting")
+        # The query tests are independent and spend their time waiting on
+        # agent queries, so they all run concurrently on one event loop.
+        # They are started before anything is printed, and the yield lets
+        # each one launch its query so the printing below overlaps them.
+        self._deadline = Deadline(self.total_timeout)
+        tasks = [asyncio.create_task(self._execute(test)) for test in self.LOCAL_TESTS]
+        self._query_tasks = tasks
+        await asyncio.sleep(0)
         
-        print("\n[*] Executing tests...\n")
-        
-        # Test 1: Financial query
-        print("Test 1/5: Financial Query...")
-        result = self.test_local_financial_query()
-        self.results.append(result)
-        print(f"  {result}")
+        self.print_section("Task 10.1: Testing Local Script with Real Queries")
         
-        # Test 2: Web search query
-        print("\nTest 2/5: Web Search Query...")
-        result = self.test_local_web_search_query()
-        self.results.append(result)
-        print(f"  {result}")
+        total = len(self.LOCAL_TESTS) + 1
         
-        # Test 3: Combined query
-        print("\nTest 3/5: Multi-Agent Query...")
-        result = self.test_local_combined_query()
-        self.results.append(result)
-        print(f"  {result}")
+        self._emit(
+            "",
+            "[*] Test Plan:",
+            *(
+                f"  {number}. {test.label}: '{test.query}'"
+                for number, test in enumerate(self.LOCAL_TESTS, start=1)
+            ),
+            f"  {total}. Verify response formatting",
+            "",
+            "[*] Executing tests...",
+            ""
+        )
         
-        # Test 4: Invalid ticker
-        print("\nTest 4/5: Invalid Ticker Error Handling...")
-        result = self.test_local_invalid_ticker()
-        self.results.append(result)
-        print(f"  {result}")
+        # Results print in plan order as they become available
+        for number, (test, task) in enumerate(zip(self.LOCAL_TESTS, tasks), start=1):
+            try:
+                result = await task
+            except asyncio.CancelledError:
+                # Only tests cancelled by _skip_pending_queries become skips
+                if not task.cancelled():
+                    raise
+                result = TestResult(
+                    test.name, False, "Skipped: model host unreachable", skipped=True
+                )
+            self.results.append(result)
+            self._emit(
+                *([""] if number > 1 else []),
+                f"Test {number}/{total}: {test.label}...",
+                f"  {result}"
+            )
         
-        # Test 5: Response formatting
-        print("\nTest 5/5: Response Formatting...")
+        # Final test: response formatting (depends on the results above)
         result = self.test_response_formatting()
         self.results.append(result)
-        print(f"  {result}")
+        self._emit("", f"Test {total}/{total}: Response Formatting...", f"  {result}")
     
     def print_summary(self):
         """Print test execution summary."""
         self.print_section("Test Summary")
         
-        passed = [r for r in self.results if r.passed]
-        failed = [r for r in self.results if not r.passed]
+        # Split results in a single pass
+        passed, failed, skipped = [], [], []
+        for result in self.results:
+            if result.skipped:
+                skipped.append(result)
+            else:
+                (passed if result.passed else failed).append(result)
         
-        print(f"\n[*] Results: {len(passed)}/{len(self.results)} tests passed")
+        counts = f"[*] Results: {len(passed)}/{len(self.results)} tests passed"
+        if skipped:
+            counts += f", {len(skipped)} skipped"
+        lines = ["", counts]
         
         if failed:
-            print("\n[-] Failed Tests:")
+            lines += ["", "[-] Failed Tests:"]
             for result in failed:
-                print(f"  - {result.test_name}")
-                print(f"    {result.message}")
+                lines += [f"  - {result.test_name}", f"    {result.message}"]
+        
+        if skipped:
+            lines += ["", "[!] Skipped Tests:"]
+            for result in skipped:
+                lines += [f"  - {result.test_name}", f"    {result.message}"]
         
         if passed:
-            print("\n[+] Passed Tests:")
-            for result in passed:
-                print(f"  - {result.test_name}")
+            lines += ["", "[+] Passed Tests:"]
+            lines += [f"  - {result.test_name}" for result in passed]
         
-        print("\n" + "=" * 80)
         if len(passed) == len(self.results):
-            print("  [+] ALL TESTS PASSED - Task 10.1 Complete")
+            verdict = "  [+] ALL TESTS PASSED - Task 10.1 Complete"
+        elif failed:
+            verdict = f"  [!] {len(failed)} TEST(S) FAILED - Review required"
         else:
-            print(f"  [!] {len(failed)} TEST(S) FAILED - Review required")
-        print("=" * 80)
+            verdict = f"  [!] {len(skipped)} TEST(S) SKIPPED - Review required"
+        lines += ["", _HLINE_EQ, verdict, _HLINE_EQ]
+        
+        self._emit(*lines)
     
     def run(self):
         """Run complete validation suite."""
@@ -359,15 +762,22 @@ class EndToEndValidator:
         
         # Check prerequisites
         if not self.check_prerequisites():
-            print("\n[-] Prerequisites not met. Cannot proceed with tests.")
-            print("\nTo run tests:")
-            print("  1. Create .env file from .env.example")
-            print("  2. Add valid API keys (PHIDATA_API_KEY, GROQ_API_KEY, OPENAI_API_KEY)")
-            print("  3. Run this script again: python test_end_to_end.py")
+            self._emit(
+                "",
+                "[-] Prerequisites not met. Cannot proceed with tests.",
+                "",
+                "To run tests:",
+                "  1. Create .env file from .env.example",
+                "  2. Add valid API keys (PHIDATA_API_KEY, GROQ_API_KEY, OPENAI_API_KEY)",
+                "  3. Run this script again: python test_end_to_end.py"
+            )
             return False
         
+        # Load the model once, untimed, before the concurrent queries
+        self.warmup_model()
+        
         # Run local tests
-        self.run_local_tests()
+        asyncio.run(self.run_local_tests())
         
         # Print summary
         self.print_summary()
@@ -376,9 +786,41 @@ class EndToEndValidator:
         return all(r.passed for r in self.results)
 
 
+def parse_arguments():
+    """
+    Parse command-line arguments.
+    
+    Returns:
+        argparse.Namespace: Parsed arguments
+    """
+    parser = argparse.ArgumentParser(description="End-to-end validation for the Financial AI Agent System")
+    parser.add_argument(
+        '--subprocess',
+        action='store_true',
+        help='Run each query in a separate financial_agent.py process instead of in-process'
+    )
+    parser.add_argument(
+        '--total-timeout',
+        type=float,
+        default=180,
+        help='Seconds all query tests together may take (default: 180)'
+    )
+    parser.add_argument(
+        '--use-cache',
+        action='store_true',
+        help=f'Reuse successful query results from earlier runs, kept in {_CACHE_DIR}/ (requires diskcache)'
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main execution function."""
-    validator = EndToEndValidator()
+    args = parse_arguments()
+    validator = EndToEndValidator(
+        use_subprocess=args.subprocess,
+        total_timeout=args.total_timeout,
+        use_cache=args.use_cache
+    )
     success = validator.run()
     
     # Exit with appropriate code